@@ -10,60 +10,177 @@ Features:
 
 import sys
 import os
-import signal
+import importlib
+import hashlib
+import json
+from functools import lru_cache
 from pathlib import Path
-from time import sleep
+from typing import TYPE_CHECKING
 from loguru import logger
-from application.use_cases.pdf_to_markdown import PDFToMarkdownUseCase
-from application.use_cases.document_comparison import DocumentComparisonUseCase
-from adapters.inbound.cli.config_menu import ConfigMenu
 from config.llm_config import LLMConfig
-from adapters.out.ocr.pymupdf_adapter import PyMuPDFAdapter
-from adapters.out.llm.llm_refiner import LLMRefiner
-from adapters.out.storage.file_storage import FileStorage
+from adapters.inbound.cli.prompts import PROVIDERS, prompt_choice, read_input
+
+# Use cases and adapters (PyMuPDF, PDFium, LLM clients) are imported inside the
+# functions that use them, so the menu starts without loading them.
+if TYPE_CHECKING:
+    from application.use_cases.pdf_to_markdown import PDFToMarkdownUseCase
 
 PDF_DIR = Path("pdfs")
 
-def _show_llm_status() -> None:
-    """Display current LLM configuration status."""
-    provider = LLMConfig.get_current_provider()
-    status = "Disabled" if provider is None else f"Enabled ({provider})"
-    print(f"\nLLM Processing: {status}")
+# Last listing of PDF_DIR, keyed by the directory's mtime
+_pdf_cache: tuple[int, tuple[str, ...]] | None = None
+
+# Menu texts, built once and written with a single call per iteration
+_MENU_STR = (
+    "\nLLM Processing: {status}\n"
+    "\nOCR-PYMUPDF System\n"
+    "1. Select Processing Mode {mode}\n"
+    "2. Convert PDF to Markdown\n"
+    "3. Compare Documents\n"
+    "4. Exit\n"
+)
+_MODE_MENU_STR = (
+    "\nProcessing Mode Selection\n"
+    "1. Traditional (PyMuPDF + OCR when needed)\n"
+    "2. LLM-Enhanced (Traditional + LLM refinement)\n"
+    "3. Back\n"
+)
+_PROVIDER_MENU_STR = "\nAvailable LLM Providers:\n" + "".join(
+    f"{i}. {name}\n" for i, (name, _, _) in enumerate(PROVIDERS.values(), 1)
+) + f"{len(PROVIDERS) + 1}. Back\n"
+
+
+# Valid answers for each menu prompt
+_MENU_CHOICES = frozenset({"1", "2", "3", "4"})
+_MODE_CHOICES = frozenset({"1", "2", "3"})
+_PROVIDER_BACK = str(len(PROVIDERS) + 1)
+_PROVIDER_CHOICES = frozenset(str(i) for i in range(1, len(PROVIDERS) + 2))
+
+
+# Provider classes already imported by _load_provider_class
+_PROVIDER_CACHE: dict[str, type] = {}
+
+
+def _load_provider_class(provider_key: str) -> type:
+    """Import and return the provider class for a config key (imported on demand).
+
+    Only the selected provider's SDK is loaded; the class is cached afterwards.
+    """
+    cls = _PROVIDER_CACHE.get(provider_key)
+    if cls is None:
+        _, module_name, class_name = PROVIDERS[provider_key]
+        cls = getattr(importlib.import_module(module_name), class_name)
+        _PROVIDER_CACHE[provider_key] = cls
+    return cls
+
+
+# Initialized providers, keyed by (config key, hash of their settings)
+_PROVIDER_INSTANCES: dict[tuple[str, str], object] = {}
+
+
+def get_provider(provider_key: str, config: dict):
+    """Return an initialized provider, reusing it while its settings are unchanged.
+
+    Later conversions keep the provider's HTTP client (and its open
+    connections) instead of building and initializing a new one.
+
+    Args:
+        provider_key: Provider config key (e.g. "openai")
+        config: Provider settings from ``load_api_settings``
+
+    Returns:
+        Initialized provider instance
+    """
+    config_hash = hashlib.sha256(
+        json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    provider = _PROVIDER_INSTANCES.get((provider_key, config_hash))
+    if provider is None:
+        provider = _load_provider_class(provider_key)()
+        provider.initialize(config)
+        _PROVIDER_INSTANCES[(provider_key, config_hash)] = provider
+    return provider
+
+
+def _validated_config(provider_key: str) -> dict:
+    """Return the provider's settings, checked to be present and to have an API key.
+
+    ``load_api_settings`` already caches the settings until .env changes and
+    returns a fresh copy, so the check runs on that copy.
+
+    Raises:
+        ValueError: If the provider has no configuration or no API key
+    """
+    from config.api_settings import load_api_settings
+    name = PROVIDERS[provider_key][0]
+    config = load_api_settings().get(provider_key)
+    if config is None:
+        logger.error(f"No configuration found for {name}")
+        raise ValueError(f"No configuration found for {name}")
+    if not config.get("api_key"):
+        logger.error(f"No API key found for {name}")
+        raise ValueError(f"No API key found for {name}")
+    return config
+
+
+@lru_cache(maxsize=1)
+def _document_port():
+    """PyMuPDF adapter shared by every conversion in the process."""
+    from adapters.out.ocr.pymupdf_adapter import PyMuPDFAdapter
+    return PyMuPDFAdapter()
+
+
+@lru_cache(maxsize=1)
+def _storage_port():
+    """File storage shared by every conversion in the process."""
+    from adapters.out.storage.file_storage import FileStorage
+    return FileStorage()
+
+
+@lru_cache(maxsize=4)
+def _llm_refiner(provider):
+    """LLM refiner for an initialized provider, reused while the provider is."""
+    from adapters.out.llm.llm_refiner import LLMRefiner
+    from infrastructure.llm_cache import LLMCache
+    return LLMRefiner(provider, cache=LLMCache())
+
+
+@lru_cache(maxsize=4)
+def build_markdown_use_case(llm_port=None) -> "PDFToMarkdownUseCase":
+    """Wire the PDF to Markdown use case with the default adapters.
+
+    Shared by the interactive menu and the non-interactive entry point. The
+    use case is stateless, so one instance is kept per ``llm_port``.
+    """
+    from application.use_cases.pdf_to_markdown import PDFToMarkdownUseCase
+    from infrastructure.markdown_cache import MarkdownCache
+
+    return PDFToMarkdownUseCase(
+        document_port=_document_port(),
+        storage_port=_storage_port(),
+        llm_port=llm_port,
+        markdown_cache=MarkdownCache()
+    )
+
+
+def _llm_status(provider: str | None) -> str:
+    """Get the LLM configuration status text for the current provider."""
+    return "Disabled" if provider is None else f"Enabled ({provider})"
 
 def _convert_pdf(pdf_path: Path) -> None:
     """Convert PDF to Markdown using current configuration."""
     logger.info(f"Converting to Markdown: {pdf_path}")
     try:
-        # Initialize basic ports
-        document_port = PyMuPDFAdapter()
-        storage_port = FileStorage()
         llm_port = None
         
         # Configurar LLM solo si está activado
         provider_name = LLMConfig.get_current_provider()
         if provider_name:
-            # Importar el proveedor específico
-            if provider_name == "openai":
-                from adapters.providers.openai_provider import OpenAIProvider
-                provider = OpenAIProvider()
-            elif provider_name == "gemini":
-                from adapters.providers.gemini_provider import GeminiProvider
-                provider = GeminiProvider()
-            elif provider_name == "deepseek":
-                from adapters.providers.deepseek_provider import DeepSeekProvider
-                provider = DeepSeekProvider()
-            
             # Intentar inicializar el proveedor LLM
             try:
                 # Obtener la configuración del proveedor
-                from config.api_settings import load_api_settings
-                api_config = load_api_settings()
-                
-                if provider_name not in api_config:
-                    raise ValueError(f"No configuration found for {provider_name}")
-                    
-                provider.initialize(api_config[provider_name])
-                llm_port = LLMRefiner(provider)
+                provider = get_provider(provider_name, _validated_config(provider_name))
+                llm_port = _llm_refiner(provider)
                 logger.info(f"Using LLM refinement with {provider_name}")
             except Exception as e:
                 logger.error(f"Failed to initialize LLM provider: {e}")
@@ -73,19 +190,32 @@ def _convert_pdf(pdf_path: Path) -> None:
             logger.info("Using traditional processing without LLM refinement")
         
         # Create and execute use case with required ports
-        use_case = PDFToMarkdownUseCase(
-            document_port=document_port,
-            storage_port=storage_port,
-            llm_port=llm_port
-        )
+        use_case = build_markdown_use_case(llm_port)
         md_path = use_case.execute(pdf_path)
         print(f"[OK] Markdown generated: {md_path}")
     except Exception as e:
         print(f"[Error] Failed to convert PDF: {e}")
 
-def list_pdfs() -> list[str]:
-    """List available PDFs in the pdfs directory."""
-    return [p.name for p in sorted(PDF_DIR.glob("*.pdf"))]
+
+def list_pdfs() -> tuple[str, ...]:
+    """List available PDFs (any case of the .pdf extension) in the pdfs directory.
+
+    The directory is only rescanned when its mtime changes (a file was
+    added, removed or renamed).
+    """
+    global _pdf_cache
+    try:
+        mtime = PDF_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return ()
+    if _pdf_cache is not None and _pdf_cache[0] == mtime:
+        return _pdf_cache[1]
+    with os.scandir(PDF_DIR) as it:
+        names = [e.name for e in it if e.name.lower().endswith(".pdf") and e.is_file()]
+    names.sort()
+    files = tuple(names)
+    _pdf_cache = (mtime, files)
+    return files
 
 def select_pdf(prompt: str = "\nSelect number: ") -> str | None:
     """Show PDF selection menu."""
@@ -99,7 +229,7 @@ def select_pdf(prompt: str = "\nSelect number: ") -> str | None:
         print(f"{i}. {pdf}")
     
     try:
-        sel = input(prompt).strip()
+        sel = read_input(prompt).strip()
         if sel.isdigit() and 1 <= int(sel) <= len(files):
             return files[int(sel) - 1]
         print("[ERROR] Invalid selection")
@@ -111,14 +241,9 @@ def select_pdf(prompt: str = "\nSelect number: ") -> str | None:
 def select_processing_mode() -> None:
     """Select between traditional or LLM-enhanced processing."""
     while True:
-        print("\nProcessing Mode Selection")
-        print("1. Traditional (PyMuPDF + OCR when needed)")
-        print("2. LLM-Enhanced (Traditional + LLM refinement)")
-        print("3. Back")
+        sys.stdout.write(_MODE_MENU_STR)
         
-        choice = input("\nSelect mode (1-3): ").strip()
-        
-        match choice:
+        match prompt_choice("\nSelect mode (1-3): ", _MODE_CHOICES):
             case "1":
                 LLMConfig.set_provider(None)  # Desactivar LLM
                 print("\n[OK] Traditional mode activated - No LLM refinement will be used")
@@ -128,69 +253,40 @@ def select_processing_mode() -> None:
                     return
             case "3":
                 return
-            case _:
-                print("\n[ERROR] Invalid option. Please select 1, 2 or 3")
-        
+
 def select_llm_provider() -> bool:
     """Select and validate LLM provider.
     
     Returns:
         bool: True if a provider was successfully selected, False otherwise
     """
-    from adapters.providers.openai_provider import OpenAIProvider
-    from adapters.providers.gemini_provider import GeminiProvider
-    from adapters.providers.deepseek_provider import DeepSeekProvider
-    
     providers = {
-        "1": ("OpenAI GPT", OpenAIProvider),
-        "2": ("Google Gemini", GeminiProvider),
-        "3": ("DeepSeek", DeepSeekProvider)
+        str(i): (name, key)
+        for i, (key, (name, _, _)) in enumerate(PROVIDERS.items(), 1)
     }
     
     while True:
-        print("\nAvailable LLM Providers:")
-        for key, (name, _) in providers.items():
-            print(f"{key}. {name}")
-        print("4. Back")
+        sys.stdout.write(_PROVIDER_MENU_STR)
         
-        choice = input("\nSelect provider (1-4): ").strip()
+        choice = prompt_choice(f"\nSelect provider (1-{_PROVIDER_BACK}): ", _PROVIDER_CHOICES)
         
-        if choice == "4":
+        if choice == _PROVIDER_BACK:
             return False
             
-        if choice not in providers:
-            print("\n[ERROR] Invalid option. Please select 1-4")
-            continue
-            
-        name, provider_class = providers[choice]
+        name, provider_key = providers[choice]
         
         try:
-            # Cargar la configuración del proveedor
-            from config.api_settings import load_api_settings
-            api_config = load_api_settings()
-            
-            # Crear instancia del proveedor
-            provider = provider_class()
-            provider_key = provider.get_config_key()
-            
-            # Verificar que tenemos configuración para este proveedor
-            if provider_key not in api_config:
-                logger.error(f"No configuration found for {name}")
-                raise ValueError(f"No configuration found for {name}")
-            
-            config = api_config[provider_key]
-            if not config.get("api_key"):
-                logger.error(f"No API key found for {name}")
-                raise ValueError(f"No API key found for {name}")
+            # Cargar y verificar la configuración del proveedor
+            config = _validated_config(provider_key)
             
             # Intentar inicializar el proveedor
-            logger.debug(f"Initializing {name} with config (API Key: {config['api_key'][:10]}...)")
-            provider.initialize(config)
+            logger.opt(lazy=True).debug("Initializing {} with config (API Key: {}...)", lambda: name, lambda: config['api_key'][:10])
+            get_provider(provider_key, config)
             
             # Si la inicialización es exitosa, activar el proveedor
             print(f"\nActivating {name}...")
             LLMConfig.set_provider(provider_key)
-            logger.debug(f"Successfully initialized {name}")
+            logger.debug("Successfully initialized {}", name)
             return True
             
         except Exception as e:
@@ -202,9 +298,9 @@ def select_llm_provider() -> bool:
             print("\n[INFO] Falling back to Traditional mode")
             return False
     
-def _get_mode_display() -> str:
-    """Get the current processing mode display text."""
-    provider = LLMConfig.get_current_provider()
+
+def _get_mode_display(provider: str | None) -> str:
+    """Get the processing mode display text for the current provider."""
     return f"[{provider.upper() if provider else 'Modo Clásico'}]"
 
 def _compare_pdfs() -> None:
@@ -221,9 +317,12 @@ def _compare_pdfs() -> None:
         if not new_pdf:
             return
             
-        # Inicializar puertos necesarios
-        document_port = PyMuPDFAdapter()
-        storage_port = FileStorage()
+        from application.use_cases.document_comparison import DocumentComparisonUseCase
+        from adapters.out.ocr.pypdfium_adapter import PypdfiumDocumentAdapter
+
+        # Inicializar puertos necesarios (PDFium extrae texto más rápido)
+        document_port = PypdfiumDocumentAdapter()
+        storage_port = _storage_port()
         
         # Crear y ejecutar caso de uso
         use_case = DocumentComparisonUseCase(
@@ -258,15 +357,9 @@ def mostrar_menu() -> None:
     """Display and handle the main menu."""
     while True:
         try:
-            _show_llm_status()
-            print("\nOCR-PYMUPDF System")
-            print(f"1. Select Processing Mode {_get_mode_display()}")
-            print("2. Convert PDF to Markdown")
-            print("3. Compare Documents")
-            print("4. Exit")
-            choice = input("\nSelect option (1-4): ").strip()
-
-            match choice:
+            provider = LLMConfig.get_current_provider()
+            sys.stdout.write(_MENU_STR.format(status=_llm_status(provider), mode=_get_mode_display(provider)))
+            match prompt_choice("\nSelect option (1-4): ", _MENU_CHOICES):
                 case "1":
                     select_processing_mode()
                 case "2":
@@ -277,8 +370,10 @@ def mostrar_menu() -> None:
                 case "4":
                     print("\nGoodbye!")
                     sys.exit(0)
-                case _:
-                    print("[ERROR] Invalid option")
+        except EOFError:
+            # End of piped input: nothing more to read
+            print("\nGoodbye!")
+            return
         except Exception as e:
             logger.exception("Error in menu")
             print(f"[ERROR] {e}")
\ No newline at end of file
@@ -1,46 +1,51 @@
 """Configuration menu for LLM settings."""
+import sys
 from typing import Dict, Any
 from config.llm_config import LLMConfig
-from config.api_settings import load_api_settings
+from config.api_settings import invalidate_api_settings, load_api_settings
+from adapters.inbound.cli.prompts import PROVIDERS as LLM_PROVIDERS, prompt_choice
 from infrastructure.logging_setup import logger
 
 class ConfigMenu:
     """Handles LLM configuration through interactive menu."""
     
+    # Built from the CLI provider table so both menus offer the same providers
     PROVIDERS = {
         "1": ("No LLM Processing", None),
-        "2": ("OpenAI GPT", "openai"),
-        "3": ("Google Gemini", "gemini"),
-        "4": ("DeepSeek API", "deepseek")
+        **{
+            str(i): (name, key)
+            for i, (key, (name, _, _)) in enumerate(LLM_PROVIDERS.items(), 2)
+        }
     }
+    _CHOICES = frozenset(PROVIDERS) | {"0"}
+
+    # Menu text, built once; only the current provider changes between redraws
+    _MENU_TEMPLATE = (
+        "\n=== LLM Provider Configuration ===\n"
+        "Current provider: {current}\n"
+        "\nAvailable providers:\n"
+        + "".join(f"{key}. {name}\n" for key, (name, _) in PROVIDERS.items())
+        + "0. Return to main menu\n"
+    )
     
     @classmethod
     def show_provider_menu(cls) -> None:
         """Display and handle LLM provider selection menu."""
         while True:
             current = LLMConfig.get_current_provider()
-            print("\n=== LLM Provider Configuration ===")
-            print(f"Current provider: {current or 'No LLM Processing'}")
-            print("\nAvailable providers:")
-            
-            for key, (name, _) in cls.PROVIDERS.items():
-                print(f"{key}. {name}")
-            print("0. Return to main menu")
+            sys.stdout.write(cls._MENU_TEMPLATE.format(current=current or 'No LLM Processing'))
             
-            choice = input("\nSelect provider (0-3): ").strip()
+            choice = prompt_choice(f"\nSelect provider (0-{len(cls.PROVIDERS)}): ", cls._CHOICES)
             
             if choice == "0":
                 break
                 
-            if choice in cls.PROVIDERS:
-                name, provider = cls.PROVIDERS[choice]
-                print(f"\nSetting provider to: {name}")
-                LLMConfig.set_provider(provider)
-                
-                if provider:
-                    cls._configure_provider(provider)
-            else:
-                print("Invalid option. Please try again.")
+            name, provider = cls.PROVIDERS[choice]
+            print(f"\nSetting provider to: {name}")
+            LLMConfig.set_provider(provider)
+
+            if provider:
+                cls._configure_provider(provider)
     
     @classmethod
     def _configure_provider(cls, provider: str) -> None:
@@ -73,6 +78,7 @@ class ConfigMenu:
                 # Update config with new settings
                 current_config["settings"] = new_settings
                 LLMConfig.save_config(current_config)
+                invalidate_api_settings()
                 print("\nSettings updated successfully")
             
         except Exception as e:
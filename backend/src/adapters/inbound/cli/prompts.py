@@ -0,0 +1,37 @@
+"""Prompt helpers and provider table shared by the CLI menus."""
+
+import sys
+
+# LLM providers: config key -> (display name, module, class)
+PROVIDERS = {
+    "openai": ("OpenAI GPT", "adapters.out.llm.openai_provider", "OpenAIProvider"),
+    "gemini": ("Google Gemini", "adapters.out.llm.gemini_provider", "GeminiProvider"),
+    "deepseek": ("DeepSeek", "adapters.out.llm.deepseek_provider", "DeepSeekProvider"),
+}
+
+
+def _read_line(prompt: str) -> str:
+    """Prompt reader for piped/scripted stdin: plain readline, no readline hooks."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+# Interactive terminals keep input() (line editing); pipes read stdin directly
+read_input = input if sys.stdin is not None and sys.stdin.isatty() else _read_line
+
+
+def prompt_choice(prompt: str, valid: frozenset[str]) -> str:
+    """Prompt until the stripped answer is one of ``valid`` and return it.
+
+    Raises:
+        EOFError: At end of piped input
+    """
+    while True:
+        choice = read_input(prompt).strip()
+        if choice in valid:
+            return choice
+        print("[ERROR] Invalid option")
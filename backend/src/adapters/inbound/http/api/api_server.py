@@ -6,6 +6,7 @@ import uvicorn
 import os
 from pathlib import Path
 from dotenv import load_dotenv
+from adapters.inbound.http.api.server_options import uvicorn_options
 
 # Cargar variables de entorno
 load_dotenv()
@@ -25,8 +26,8 @@ def main():
         "adapters.inbound.http.api:app",
         host=host,
         port=port,
-        reload=True,  # Habilitar recarga automática en desarrollo
-        log_level="info"
+        log_level="info",
+        **uvicorn_options()
     )
 
 if __name__ == "__main__":
@@ -80,6 +80,7 @@ async def startup_event():
 def start_app():
     """Inicia la aplicación FastAPI."""
     import uvicorn
+    from adapters.inbound.http.api.server_options import uvicorn_options
     
     # Configurar host y puerto
     host = os.getenv("WEB_HOST", "0.0.0.0")
@@ -90,8 +91,8 @@ def start_app():
         "adapters.inbound.http.api.app:app",
         host=host,
         port=port,
-        reload=True,  # Habilitar recarga automática en desarrollo
-        log_level="info"
+        log_level="info",
+        **uvicorn_options()
     )
 
 if __name__ == "__main__":
@@ -9,6 +9,8 @@ from typing import List, Optional
 import os
 import shutil
 import time
+import uuid
+from datetime import datetime
 from pathlib import Path
 
 # Importaciones del dominio
@@ -21,6 +23,7 @@ from adapters.out.llm.llm_refiner import LLMRefiner
 
 # Importaciones de infraestructura
 from adapters.out.storage.file_storage import FileStorage
+from infrastructure.logging_setup import logger, log_error_details, log_document_processing
 from adapters.inbound.http.document_service import DocumentService
 from adapters.inbound.http.models import (
     DocumentCreate, 
@@ -56,11 +59,6 @@ def _resolve_llm_port():
     Returns:
         LLMPort or None: Una instancia del puerto LLM si hay claves disponibles, None en caso contrario
     """
-    import os
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
     # Verificar claves de API disponibles
     openai_key = os.getenv("OPENAI_API_KEY")
     gemini_key = os.getenv("GEMINI_API_KEY")
@@ -89,8 +87,6 @@ async def process_document(input_dto: DocumentInputDTO, doc_id: str, use_case: P
         doc_id: ID único del documento
         use_case: Caso de uso para procesar el documento
     """
-    from infrastructure.logging_setup import logger, log_error_details, log_document_processing
-    
     try:
         # Registrar inicio del procesamiento
         logger.info(f"Iniciando procesamiento del documento {doc_id}: {input_dto.file_path}")
@@ -216,7 +212,6 @@ async def list_documents(
     result = []
     for doc in documents:
         # Convertir fechas de texto a objetos datetime
-        from datetime import datetime
         created_at = datetime.fromisoformat(doc["created_at"])
         updated_at = datetime.fromisoformat(doc["updated_at"]) if doc["updated_at"] else None
         
@@ -252,10 +247,6 @@ async def create_document(
     Returns:
         DocumentResponse: Información del documento creado
     """
-    from infrastructure.logging_setup import logger
-    import uuid
-    from datetime import datetime
-    
     try:
         # Validar el tipo de archivo
         if not file.filename.lower().endswith('.pdf'):
@@ -334,7 +325,6 @@ async def get_document_status(doc_id: str):
         metadata = DocumentService.get_document(doc_id)
         
         # Convertir fechas de texto a objetos datetime
-        from datetime import datetime
         created_at = datetime.fromisoformat(metadata["created_at"])
         updated_at = datetime.fromisoformat(metadata["updated_at"]) if metadata["updated_at"] else None
         
@@ -0,0 +1,25 @@
+"""Opciones de Uvicorn compartidas por los scripts que arrancan la API."""
+import importlib.util
+import os
+from typing import Any, Dict
+
+
+def uvicorn_options() -> Dict[str, Any]:
+    """
+    Construye las opciones de ``uvicorn.run`` que dependen del entorno.
+
+    La recarga automática (``API_RELOAD=true``) es solo para desarrollo e implica
+    un único proceso; en producción se lanzan ``API_WORKERS`` procesos (por
+    defecto, uno por núcleo). Se usan uvloop y httptools si están instalados
+    (uvicorn[standard]).
+
+    Returns:
+        Dict con ``reload``, ``workers``, ``loop`` y ``http``
+    """
+    reload = os.getenv("API_RELOAD", "false").lower() == "true"
+    return {
+        "reload": reload,
+        "workers": 1 if reload else int(os.getenv("API_WORKERS", os.cpu_count() or 1)),
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "auto",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "auto",
+    }
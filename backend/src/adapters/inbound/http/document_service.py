@@ -8,12 +8,37 @@ from pathlib import Path
 from datetime import datetime
 import uuid
 import os
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 
 # Directorio para almacenar metadatos de documentos
 METADATA_DIR = Path("metadata")
 METADATA_DIR.mkdir(exist_ok=True)
 
+
+def _remove_matching(directory: Path, matches: Callable[[str], bool]) -> int:
+    """Elimina los archivos de *directory* cuyo nombre cumple *matches*.
+
+    Recorre el directorio una sola vez con ``os.scandir`` y filtra por nombre
+    en memoria, sin un ``stat`` adicional por entrada.
+
+    Returns:
+        int: Número de archivos eliminados
+    """
+    removed = 0
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not matches(entry.name) or not entry.is_file():
+                    continue
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except FileNotFoundError:
+                    pass  # Eliminado por otro proceso
+    except FileNotFoundError:
+        pass  # El directorio aún no existe
+    return removed
+
 class DocumentService:
     """Servicio para gestionar documentos y su estado."""
     
@@ -122,14 +147,19 @@ class DocumentService:
         """
         documents = []
         
-        # Listar archivos de metadatos
-        metadata_files = list(METADATA_DIR.glob("*.json"))
+        # Listar archivos de metadatos con su mtime (un recorrido, un stat por entrada)
+        with os.scandir(METADATA_DIR) as entries:
+            metadata_files = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
         
         # Ordenar por fecha de creación (más recientes primero)
-        metadata_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+        metadata_files.sort(reverse=True)
         
         # Aplicar paginación
-        paginated_files = metadata_files[offset:offset + limit]
+        paginated_files = [path for _, path in metadata_files[offset:offset + limit]]
         
         # Cargar metadatos
         for metadata_path in paginated_files:
@@ -151,20 +181,16 @@ class DocumentService:
         """
         metadata_path = METADATA_DIR / f"{doc_id}.json"
         
-        if not metadata_path.exists():
-            return False
-        
         # Eliminar metadatos
-        os.remove(metadata_path)
+        try:
+            os.remove(metadata_path)
+        except FileNotFoundError:
+            return False
         
         # Eliminar archivo original
-        upload_dir = Path("uploads")
-        for file in upload_dir.glob(f"{doc_id}*"):
-            os.remove(file)
+        _remove_matching(Path("uploads"), lambda name: name.startswith(doc_id))
         
         # Eliminar resultados
-        result_dir = Path("resultado")
-        for file in result_dir.glob(f"*{doc_id}*.md"):
-            os.remove(file)
+        _remove_matching(Path("resultado"), lambda name: doc_id in name and name.endswith(".md"))
         
         return True
\ No newline at end of file
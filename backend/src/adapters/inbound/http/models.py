@@ -3,11 +3,21 @@
 Este módulo define los modelos de datos utilizados en la API REST,
 implementados con Pydantic para validación y serialización.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 
-class DocumentBase(BaseModel):
+
+class APIModel(BaseModel):
+    """Base de los modelos de la API.
+
+    Los modelos son inmutables (se construyen una vez por respuesta) e ignoran
+    campos desconocidos en lugar de almacenarlos en ``model_extra``.
+    """
+    model_config = ConfigDict(frozen=True, extra='ignore', validate_assignment=False)
+
+
+class DocumentBase(APIModel):
     """Modelo base para documentos."""
     id: str = Field(..., description="ID único del documento")
     filename: str = Field(..., description="Nombre original del archivo")
@@ -20,7 +30,8 @@ class DocumentStatus(DocumentBase):
     updated_at: Optional[datetime] = Field(None, description="Última actualización")
     error_message: Optional[str] = Field(None, description="Mensaje de error si ocurrió alguno")
 
-class DocumentCreate(BaseModel):
+
+class DocumentCreate(APIModel):
     """Datos para crear un nuevo documento."""
     use_llm: bool = Field(False, description="Si se debe usar LLM para refinar el texto")
     process_tables: bool = Field(True, description="Si se deben procesar tablas")
@@ -36,7 +47,8 @@ class DocumentResponse(DocumentBase):
     markdown_url: Optional[str] = Field(None, description="URL para descargar el Markdown")
     error_message: Optional[str] = Field(None, description="Mensaje de error si ocurrió alguno")
 
-class PageInfo(BaseModel):
+
+class PageInfo(APIModel):
     """Información sobre una página del documento."""
     page_number: int = Field(..., description="Número de página")
     has_text: bool = Field(True, description="Si la página contiene texto")
@@ -51,6 +63,7 @@ class DocumentDetail(DocumentResponse):
     creation_date: Optional[datetime] = Field(None, description="Fecha de creación del documento original")
     language: Optional[str] = Field(None, description="Idioma detectado")
 
-class ErrorResponse(BaseModel):
+
+class ErrorResponse(APIModel):
     """Respuesta de error."""
     detail: str = Field(..., description="Mensaje de error")
\ No newline at end of file
@@ -1,29 +1,44 @@
-"""Requests implementation of HTTP client."""
-import requests
+"""HTTPX implementation of HTTP client."""
+import importlib.util
+import httpx
 from typing import Dict, Any
 from domain.ports.http_client import HTTPClientPort
 from domain.exceptions.llm_exceptions import LLMConnectionError
 
+# HTTP/2 requiere el paquete opcional 'h2' (httpx[http2])
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
 class RequestsClient(HTTPClientPort):
-    """Implementation of HTTP client using requests library."""
-    
+    """Implementation of HTTP client using a pooled httpx client.
+
+    The underlying ``httpx.Client`` is shared by every instance, so repeated
+    calls to the same LLM endpoint reuse open TCP/TLS connections.
+    """
+
+    _client = httpx.Client(
+        http2=_HTTP2,
+        timeout=60.0,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+    )
+
     def post(self, url: str, headers: Dict[str, str], json: Dict[str, Any]) -> Dict[str, Any]:
-        """Make HTTP POST request using requests library.
-        
+        """Make HTTP POST request over the shared connection pool.
+
         Args:
             url: The endpoint URL
             headers: HTTP headers
             json: Request body
-            
+
         Returns:
             Dict with response data
-            
+
         Raises:
             LLMConnectionError: If request fails
         """
         try:
-            response = requests.post(url, headers=headers, json=json)
+            response = self._client.post(url, headers=headers, json=json)
             response.raise_for_status()
             return response.json()
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             raise LLMConnectionError(f"HTTP request failed: {str(e)}")
@@ -5,22 +5,43 @@ import fasttext
 from pathlib import Path
 from loguru import logger
 
-class LanguageDetector:
-    def __init__(self):
+MODEL_PATH = Path(__file__).parent / "lid.176.ftz"
+
+# Modelo compartido por todas las instancias; se carga en el primer uso
+_MODEL = None
+_MODEL_LOADED = False
+
+
+def _get_model():
+    """
+    Devuelve el modelo FastText, cargándolo (y descargándolo) una sola vez.
+
+    Returns:
+        Modelo FastText o None si no se pudo cargar
+    """
+    global _MODEL, _MODEL_LOADED
+    if not _MODEL_LOADED:
+        _MODEL_LOADED = True
         try:
             # Cargar modelo preentrenado de FastText
-            model_path = Path(__file__).parent / "lid.176.ftz"
-            if not model_path.exists():
+            if not MODEL_PATH.exists():
                 logger.info("Descargando modelo de FastText...")
                 import urllib.request
                 urllib.request.urlretrieve(
                     "https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.ftz",
-                    model_path
+                    MODEL_PATH
                 )
-            self.model = fasttext.load_model(str(model_path))
+            _MODEL = fasttext.load_model(str(MODEL_PATH))
         except Exception as e:
             logger.error(f"Error al cargar modelo FastText: {e}")
-            self.model = None
+            _MODEL = None
+    return _MODEL
+
+class LanguageDetector:
+    @property
+    def model(self):
+        """Modelo FastText compartido (None si no está disponible)."""
+        return _get_model()
             
     def detect_language(self, text: str) -> str:
         """Detecta el idioma del texto usando FastText."""
@@ -28,7 +49,8 @@ class LanguageDetector:
             return "es"  # Valor por defecto
         
         try:
-            predictions = self.model.predict(text, k=1)
+            # FastText procesa una sola línea: no admite '\n'
+            predictions = self.model.predict(text.replace("\n", " "), k=1)
             lang_code = predictions[0][0].replace("__label__", "")
             return lang_code
         except Exception as e:
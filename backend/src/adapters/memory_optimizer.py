@@ -109,7 +109,7 @@ class MemoryOptimizer:
                 new_width = int(width * (max_size / height))
             
             image = image.resize((new_width, new_height), Image.LANCZOS)
-            self.logger.debug(f"Imagen redimensionada de {width}x{height} a {new_width}x{new_height}")
+            self.logger.debug("Imagen redimensionada de %dx%d a %dx%d", width, height, new_width, new_height)
         
         return image
     
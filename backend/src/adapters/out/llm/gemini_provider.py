@@ -29,8 +29,8 @@ class GeminiProvider(LLMProvider):
             self.model_name = config.get("model_id", "gemini-2.0-flash")
             self.max_retries = config.get("max_retries", 5)
             
-            logger.debug(f"Configuring Gemini with API key: {self.api_key[:10]}...")
-            logger.debug(f"Using model: {self.model_name}")
+            logger.debug("Configuring Gemini with API key: %.10s...", self.api_key)
+            logger.debug("Using model: %s", self.model_name)
             
             # Test connection
             url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model_name}:generateContent"
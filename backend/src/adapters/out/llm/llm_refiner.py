@@ -3,12 +3,25 @@ Adaptador para refinamiento de texto usando LLMs.
 """
 import re
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from domain.ports.llm_port import LLMPort
 from domain.ports.llm_provider import LLMProvider
 from config.api_settings import load_api_settings
+from config.state import LLMMode
+from domain.exceptions.llm_exceptions import (
+    LLMConfigurationError,
+    LLMProviderError,
+    LLMResponseError,
+)
+from infrastructure.llm_cache import LLMCache
 from infrastructure.logging_setup import logger
 
+# Temperatura de todas las llamadas de refinamiento
+_TEMPERATURE = 0.1
+
+# Instrucciones de ``format_markdown``
+_FORMAT_PROMPT = "Formatea este texto como Markdown, manteniendo su estructura y contenido:"
+
 OCR_PATTERNS = {
     r"[0Oo]": "O",
     r"[1Il]": "l",
@@ -33,14 +46,18 @@ def _detect_document_structure(text: str) -> Dict[str, List[str]]:
 class LLMRefiner(LLMPort):
     """Implementación de LLMPort que refina texto usando diferentes proveedores de LLM."""
 
-    def __init__(self, provider: LLMProvider = None) -> None:
+    def __init__(self, provider: LLMProvider = None, cache: Optional[LLMCache] = None) -> None:
         """Initialize LLM refiner with optional provider.
         
         Args:
             provider: Optional LLM provider instance
+            cache: Optional persistent cache of LLM responses; repeated
+                prompts are answered from it without calling the provider
         """
         self.provider = None
-        self.mode = "prompt"  # Por defecto modo prompt
+        self.cache = cache
+        self._model_id = None
+        self.mode = LLMMode.PROMPT  # Por defecto modo prompt
         
         if provider is not None:
             try:
@@ -49,14 +66,15 @@ class LLMRefiner(LLMPort):
                 
                 if config_key in self.api_config:
                     provider_config = self.api_config[config_key]
-                    logger.debug(f"Config for {config_key}: {provider_config}")
+                    logger.debug("Config for %s: %s", config_key, provider_config)
                     
                     if not provider_config.get("api_key"):
                         raise ValueError(f"No API key found for provider: {config_key}")
                     
-                    logger.debug(f"Initializing {config_key} provider with config")
+                    logger.debug("Initializing %s provider with config", config_key)
                     self.provider = provider
                     self.provider.initialize(provider_config)
+                    self._model_id = f"{config_key}:{provider_config.get('model_id')}"
                     logger.info(f"LLM refiner initialized with {config_key} provider")
                 else:
                     logger.error(f"No configuration found for provider: {config_key}")
@@ -64,6 +82,16 @@ class LLMRefiner(LLMPort):
                 logger.error(f"Error initializing LLM provider: {e}")
                 self.provider = None
             
+    @property
+    def cache_variant(self) -> str:
+        """
+        Identifica lo que determina la salida de ``format_markdown``.
+
+        Incluye proveedor, modelo, modo y prompt, de modo que cambiar cualquiera
+        de ellos no reutilice resultados cacheados con la configuración anterior.
+        """
+        return f"{self._model_id}|{self.mode.name}|{_FORMAT_PROMPT}"
+
     def refine_text(self, text: str) -> str:
         """
         Refina y mejora un texto usando LLM.
@@ -118,18 +146,22 @@ class LLMRefiner(LLMPort):
             
         Returns:
             str: Texto formateado en Markdown
+            
+        Raises:
+            LLMProviderError: Si no hay proveedor o el LLM falla o no devuelve
+                texto; así el llamador sabe que no hubo refinamiento real
         """
         if not self.provider:
-            logger.warning("LLM provider no disponible, retornando texto sin formatear")
-            return text
+            raise LLMConfigurationError("LLM provider no disponible")
             
         try:
-            prompt = "Formatea este texto como Markdown, manteniendo su estructura y contenido:"
-            formatted = self._safe_generate(text, prompt)
-            return formatted if formatted else text
+            formatted = self._generate(text, _FORMAT_PROMPT)
         except Exception as e:
             logger.error(f"Error formateando texto: {e}")
-            return text
+            raise LLMProviderError(f"Error formateando texto: {e}") from e
+        if not formatted:
+            raise LLMResponseError("El LLM devolvió una respuesta vacía")
+        return formatted
 
     def _safe_generate(self, prompt: str, system_prompt: str = None) -> str:
         """
@@ -143,15 +175,42 @@ class LLMRefiner(LLMPort):
             Generated completion or original text on error
         """
         try:
-            return self.provider.generate_completion(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                temperature=0.1
-            )
+            return self._generate(prompt, system_prompt)
         except Exception as e:
             logger.error(f"Error generating completion: {e}")
             return prompt
 
+    def _generate(self, prompt: str, system_prompt: str = None) -> str:
+        """
+        LLM completion generation, answered from the cache when possible.
+        
+        Args:
+            prompt: Text to process
+            system_prompt: Optional system instructions
+            
+        Returns:
+            Generated completion
+            
+        Raises:
+            Exception: Whatever the provider raises
+        """
+        cache_text = f"{system_prompt or ''}\n\n{prompt}"
+        if self.cache is not None:
+            cached = self.cache.get(cache_text, self._model_id, _TEMPERATURE)
+            if cached is not None:
+                return cached
+
+        completion = self.provider.generate_completion(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=_TEMPERATURE
+        )
+
+        # Solo se cachean respuestas reales
+        if self.cache is not None and completion:
+            self.cache.set(cache_text, self._model_id, _TEMPERATURE, completion)
+        return completion
+
     # ───────────────────── Fine-tuned model ─────────────────────
     def refine_markdown(self, raw_text: str) -> str:
         """Refine OCR text using configured LLM provider."""
@@ -24,7 +24,7 @@ class OpenAIProvider(LLMProvider):
             raise ValueError("OpenAI API key not found in configuration")
         
         try:
-            logger.debug(f"Initializing OpenAI with API key: {config['api_key'][:10]}...")
+            logger.debug("Initializing OpenAI with API key: %.10s...", config['api_key'])
             
             self.client = OpenAI(
                 api_key=config["api_key"],
@@ -35,7 +35,7 @@ class OpenAIProvider(LLMProvider):
             self.max_retries = config.get("max_retries", 5)
             
             # Verificar que la conexión funciona
-            logger.debug(f"Testing OpenAI connection with model: {self.model}")
+            logger.debug("Testing OpenAI connection with model: %s", self.model)
             test_response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": "Test connection"}],
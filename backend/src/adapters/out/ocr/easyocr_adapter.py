@@ -0,0 +1,87 @@
+"""
+OCR adapter backed by EasyOCR.
+
+Intended for installations with a CUDA GPU, where EasyOCR is much faster than
+Tesseract on scanned pages. The model is loaded on first use and reused for
+every page processed by the same adapter instance.
+
+Select it with ``OCR_ENGINE=easyocr`` (see ``OCRSettings``) or pass an instance
+to ``PyMuPDFAdapter(ocr_port=...)``.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from loguru import logger
+
+from domain.ports.ocr_port import OCRPort
+from adapters.out.ocr.ocr_adapter import clean_ocr_text, detect_table_regions, text_needs_ocr
+
+# Códigos de idioma de Tesseract → EasyOCR
+_EASYOCR_LANGS = {"spa": "es", "eng": "en", "fra": "fr", "deu": "de", "ita": "it", "por": "pt"}
+
+
+class EasyOCRAdapter(OCRPort):
+    """Adapter that implements OCRPort using EasyOCR (GPU when available)."""
+
+    def __init__(self, lang: str = "spa", gpu: bool = True) -> None:
+        """
+        Args:
+            lang: Código de idioma estilo Tesseract (p. ej. ``spa``)
+            gpu: Usar CUDA si está disponible
+        """
+        self.langs = [_EASYOCR_LANGS.get(lang, lang)]
+        self.gpu = gpu
+        self._reader: Optional[object] = None
+
+    @property
+    def reader(self):
+        """Instancia de ``easyocr.Reader``, creada en el primer uso."""
+        if self._reader is None:
+            import easyocr
+
+            logger.info(f"Cargando modelo EasyOCR ({self.langs}, gpu={self.gpu})")
+            self._reader = easyocr.Reader(self.langs, gpu=self.gpu)
+        return self._reader
+
+    def extract_text(self, image: bytes) -> str:
+        """
+        Extrae texto de una imagen usando EasyOCR.
+
+        Args:
+            image: Datos binarios de la imagen (PNG)
+
+        Returns:
+            str: Texto extraído
+        """
+        try:
+            lines = self.reader.readtext(image, detail=0, paragraph=True)
+            return clean_ocr_text("\n".join(lines))
+        except Exception as e:
+            logger.error(f"Error en EasyOCR: {e}")
+            return "[ERROR DE EASYOCR]"
+
+    def detect_tables(self, image: bytes) -> List[dict]:
+        """
+        Detecta tablas en una imagen.
+
+        Args:
+            image: Datos binarios de la imagen
+
+        Returns:
+            List[dict]: Lista de tablas detectadas con sus coordenadas
+        """
+        return detect_table_regions(image)
+
+    def needs_ocr(self, page_content: str) -> bool:
+        """
+        Determina si una página necesita OCR.
+
+        Args:
+            page_content: Contenido de texto de la página
+
+        Returns:
+            bool: True si se requiere OCR
+        """
+        return text_needs_ocr(page_content)
@@ -23,15 +23,30 @@ Idiomas soportados:
   - Instalar con: sudo apt install tesseract-ocr-spa (etc.)
 """
 
+import csv
 import logging
 import os
 import re
 import unicodedata
+from contextlib import contextmanager
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import fitz
 from PIL import Image
 
+# Motores OCR opcionales: tesserocr (API persistente) y pytesseract (CLI)
+try:
+    from tesserocr import OEM, PSM, PyTessBaseAPI
+except ImportError:
+    PyTessBaseAPI = None
+
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
 # Configuración global
 DPI = 300
 OCR_LANG = "spa"
@@ -48,80 +63,320 @@ def needs_ocr(page: fitz.Page) -> bool:
     """
     try:
         # Extraer texto directamente
-        text = page.get_text().strip()
+        return text_needs_ocr(page.get_text())
+    except Exception:
+        # En caso de error, asumir que necesita OCR
+        return True
+
+
+def text_needs_ocr(text: str) -> bool:
+    """
+    Determina si el texto embebido de una página es insuficiente y requiere OCR.
+
+    Args:
+        text: Texto extraído directamente de la página
         
-        # Si no hay texto o es muy poco, necesita OCR
-        if not text or len(text) < 10:
-            return True
-            
-        # Si la mayoría son caracteres no alfabéticos, probablemente es texto escaneado mal reconocido
-        alphabetic_chars = sum(1 for c in text if c.isalpha())
-        total_chars = len(text.replace(' ', '').replace('\n', ''))
+    Returns:
+        bool: True si necesita OCR, False si el texto es utilizable
+    """
+    text = text.strip()
+
+    # Si no hay texto o es muy poco, necesita OCR
+    if not text or len(text) < 10:
+        return True
         
-        if total_chars == 0:
-            return True
-            
-        alphabetic_ratio = alphabetic_chars / total_chars
+    # Si la mayoría son caracteres no alfabéticos, probablemente es texto escaneado mal reconocido
+    alphabetic_chars = sum(map(str.isalpha, text))
+    total_chars = len(text) - text.count(' ') - text.count('\n')
+
+    if total_chars == 0:
+        return True
         
-        # Si menos del 60% son caracteres alfabéticos, probablemente necesita OCR
-        return alphabetic_ratio < 0.6
+    alphabetic_ratio = alphabetic_chars / total_chars
+
+    # Si menos del 60% son caracteres alfabéticos, probablemente necesita OCR
+    return alphabetic_ratio < 0.6
+
+
+def create_tesseract_api() -> Optional[Any]:
+    """
+    Crea una instancia de Tesseract (tesserocr) con la configuración de OCR.
+
+    El llamador es responsable de liberarla con ``End()``.
+
+    Returns:
+        PyTessBaseAPI configurada, o None si tesserocr no está instalado
+    """
+    if PyTessBaseAPI is None:
+        return None
+
+    api = PyTessBaseAPI(lang=OCR_LANG, psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY)
+    api.SetVariable("user_defined_dpi", str(DPI))
+    return api
+
+
+@contextmanager
+def tesseract_api() -> Iterator[Optional[Any]]:
+    """
+    Abre una instancia persistente de Tesseract (tesserocr) para varias páginas.
+
+    Cargar el modelo y los datos de idioma cuesta cientos de milisegundos;
+    reutilizar la misma instancia lo amortiza entre todas las páginas.
+
+    Yields:
+        PyTessBaseAPI configurada, o None si tesserocr no está instalado
+        (en ese caso se usa pytesseract página a página).
+    """
+    api = create_tesseract_api()
+    if api is None:
+        yield None
+        return
+
+    try:
+        yield api
+    finally:
+        api.End()
+
+
+@contextmanager
+def lazy_tesseract_api() -> Iterator[Callable[[], Optional[Any]]]:
+    """
+    Como ``tesseract_api``, pero la instancia se crea la primera vez que se pide.
+
+    Los PDF digitales, o aquellos cuyas páginas escaneadas salen todas de la
+    caché, no llegan a cargar el modelo LSTM.
+
+    Yields:
+        Función sin argumentos que devuelve la PyTessBaseAPI compartida (o None
+        si tesserocr no está instalado)
+    """
+    created: List[Optional[Any]] = []
+
+    def get_api() -> Optional[Any]:
+        if not created:
+            created.append(create_tesseract_api())
+        return created[0]
+
+    try:
+        yield get_api
+    finally:
+        if created and created[0] is not None:
+            created[0].End()
+
+
+def perform_ocr_on_pages(pages: Iterable[fitz.Page]) -> List[str]:
+    """
+    Realiza OCR sobre varias páginas reutilizando una única instancia de Tesseract.
+
+    Args:
+        pages: Páginas PDF de PyMuPDF
         
-    except Exception:
-        # En caso de error, asumir que necesita OCR
-        return True
+    Returns:
+        List[str]: Texto extraído por página, en el mismo orden
+    """
+    results: List[str] = []
+    with tesseract_api() as api:
+        for page in pages:
+            results.append(perform_ocr_on_page(page, api))
+    return results
 
 
-def perform_ocr_on_page(page: fitz.Page) -> str:
+def perform_ocr_on_page(page: fitz.Page, api: Optional[Any] = None) -> str:
     """
     Realiza OCR sobre una página PDF usando Tesseract.
     
     Args:
         page: Página PDF de PyMuPDF
+        api: Instancia de ``tesseract_api`` a reutilizar (opcional)
 
     Returns:
         str: Texto extraído y procesado
     """
     try:
         # Primero intentar extraer texto directamente
-        direct_text = page.get_text().strip()
-        
-        # Si ya hay texto extraíble y es de buena calidad, usarlo
-        if direct_text and len(direct_text) > 50:
-            alphabetic_chars = sum(1 for c in direct_text if c.isalpha())
-            total_chars = len(direct_text.replace(' ', '').replace('\n', ''))
-            
-            if total_chars > 0:
-                alphabetic_ratio = alphabetic_chars / total_chars
-                if alphabetic_ratio > 0.7:  # Buen texto extraíble
-                    return clean_ocr_text(direct_text)
+        direct_text = good_direct_text(page)
+        if direct_text is not None:
+            return direct_text
         
         # Si el texto directo no es suficiente, realizar OCR
-        return _perform_tesseract_ocr(page)
+        return _perform_tesseract_ocr(page, api)
         
     except Exception as e:
         logging.error(f"Error en OCR para página {page.number + 1}: {e}")
         return f"[ERROR DE OCR EN PÁGINA {page.number + 1}]"
 
 
-def _perform_tesseract_ocr(page: fitz.Page) -> str:
+def good_direct_text(page: fitz.Page) -> Optional[str]:
+    """
+    Devuelve el texto embebido de la página si es de buena calidad.
+
+    Args:
+        page: Página PDF de PyMuPDF
+
+    Returns:
+        Optional[str]: Texto limpio, o None si la página necesita Tesseract
+    """
+    direct_text = page.get_text().strip()
+
+    # Si ya hay texto extraíble y es de buena calidad, usarlo
+    if direct_text and len(direct_text) > 50:
+        alphabetic_chars = sum(map(str.isalpha, direct_text))
+        total_chars = len(direct_text) - direct_text.count(' ') - direct_text.count('\n')
+
+        if total_chars > 0:
+            alphabetic_ratio = alphabetic_chars / total_chars
+            if alphabetic_ratio > 0.7:  # Buen texto extraíble
+                return clean_ocr_text(direct_text)
+
+    return None
+
+
+def render_page_image(page: fitz.Page) -> bytes:
+    """
+    Renderiza una página como imagen PNG para OCR.
+
+    Args:
+        page: Página PDF de PyMuPDF
+
+    Returns:
+        bytes: Imagen PNG a ``DPI`` puntos por pulgada
+    """
+    pix = page.get_pixmap(dpi=DPI, alpha=False)
+    return pix.tobytes("png")
+
+
+def pixmap_to_image(pix: fitz.Pixmap) -> Image.Image:
+    """
+    Convierte un pixmap de PyMuPDF en imagen PIL sin codificar a PNG.
+
+    Args:
+        pix: Pixmap RGB o RGBA
+
+    Returns:
+        Image.Image: Imagen que copia directamente las muestras del pixmap
+    """
+    mode = "RGB" if pix.n == 3 else "RGBA"
+    return Image.frombytes(mode, (pix.width, pix.height), pix.samples)
+
+
+def render_page_pil(page: fitz.Page, dpi: int = DPI) -> Image.Image:
+    """
+    Renderiza una página como imagen PIL para OCR, sin pasar por PNG.
+
+    Args:
+        page: Página PDF de PyMuPDF
+        dpi: Resolución de renderizado
+
+    Returns:
+        Image.Image: Imagen RGB de la página
+    """
+    return pixmap_to_image(page.get_pixmap(dpi=dpi, alpha=False))
+
+
+def preprocess_for_ocr(
+    img: Image.Image,
+    target_height: Optional[int] = None,
+    threshold: int = 128
+) -> Image.Image:
+    """
+    Prepara una imagen para Tesseract: escala de grises, reescalado y binarización.
+
+    Args:
+        img: Imagen PIL de entrada
+        target_height: Alto final en píxeles (None para conservar el tamaño)
+        threshold: Nivel de gris a partir del cual un píxel se considera fondo
+
+    Returns:
+        Image.Image: Imagen binaria (modo '1')
+    """
+    img = img.convert('L')
+    if target_height and img.height != target_height:
+        width = max(1, round(img.width * target_height / img.height))
+        img = img.resize((width, target_height), Image.LANCZOS)
+    return img.point(lambda p: 255 if p >= threshold else 0, '1')
+
+
+def _perform_tesseract_ocr(page: fitz.Page, api: Optional[Any] = None) -> str:
     """
     Ejecuta OCR con Tesseract en una página.
     
     Args:
         page: Página PDF de PyMuPDF
+        api: Instancia de ``tesseract_api`` a reutilizar (opcional)
         
     Returns:
         str: Texto extraído con OCR
     """
     try:
         # Renderizar página como imagen
-        pix = page.get_pixmap(dpi=DPI, alpha=False)
-        img_data = pix.tobytes("png")
+        img = render_page_pil(page)
+    except Exception as e:
+        logging.error(f"Error en OCR Tesseract para página {page.number + 1}: {e}")
+        return f"[ERROR CRÍTICO DE OCR EN PÁGINA {page.number + 1}]"
+
+    return ocr_image(img, page.number + 1, api)
+
+
+def ocr_image_bytes(img_data: bytes, page_number: int, api: Optional[Any] = None) -> str:
+    """
+    Ejecuta OCR con Tesseract sobre una página ya renderizada.
+
+    No usa PyMuPDF, por lo que puede ejecutarse en un hilo distinto
+    del que renderiza las páginas.
+
+    Args:
+        img_data: Imagen PNG de la página
+        page_number: Número de página (1-indexed) para mensajes de error
+        api: Instancia de ``tesseract_api`` a reutilizar (opcional)
+
+    Returns:
+        str: Texto extraído con OCR
+    """
+    try:
         img = Image.open(BytesIO(img_data))
+    except Exception as e:
+        logging.error(f"Error en OCR Tesseract para página {page_number}: {e}")
+        return f"[ERROR CRÍTICO DE OCR EN PÁGINA {page_number}]"
+
+    return ocr_image(img, page_number, api)
+
+
+def _is_blank(img: Image.Image, threshold: int = 128) -> bool:
+    """Indica si la imagen no tiene ningún píxel más oscuro que ``threshold``."""
+    return img.convert('L').getextrema()[0] >= threshold
+
+
+def ocr_image(img: Image.Image, page_number: int, api: Optional[Any] = None) -> str:
+    """
+    Ejecuta OCR con Tesseract sobre una imagen ya decodificada (página o franja).
+
+    Las imágenes sin tinta (páginas en blanco, cabeceras o pies vacíos) no
+    llegan a Tesseract: de lo contrario se harían dos pasadas (PSM 6 y PSM 3)
+    para obtener el mismo texto vacío.
+
+    Args:
+        img: Imagen a procesar
+        page_number: Número de página (1-indexed) para mensajes de error
+        api: Instancia de ``tesseract_api`` a reutilizar (opcional)
+
+    Returns:
+        str: Texto extraído con OCR
+    """
+    try:
+        if _is_blank(img):
+            return ""
+
+        if api is not None:
+            try:
+                return clean_ocr_text(_ocr_with_api(api, img))
+            except Exception as e:
+                logging.error(f"Error en Tesseract OCR: {e}")
+                return f"[ERROR DE TESSERACT EN PÁGINA {page_number}]"
         
         # OCR básico (requiere pytesseract instalado)
         try:
-            import pytesseract
+            if pytesseract is None:
+                raise ImportError("pytesseract")
             config = f"--psm 6 --oem 1 -c user_defined_dpi={DPI}"
             text = pytesseract.image_to_string(img, lang=OCR_LANG, config=config)
             
@@ -132,17 +387,41 @@ def _perform_tesseract_ocr(page: fitz.Page) -> str:
                 
         except ImportError:
             logging.warning("pytesseract no está instalado. Devolviendo texto básico.")
-            return f"[OCR NO DISPONIBLE - PÁGINA {page.number + 1}]"
+            return f"[OCR NO DISPONIBLE - PÁGINA {page_number}]"
         except Exception as e:
             logging.error(f"Error en Tesseract OCR: {e}")
-            return f"[ERROR DE TESSERACT EN PÁGINA {page.number + 1}]"
+            return f"[ERROR DE TESSERACT EN PÁGINA {page_number}]"
         
         # Limpiar y procesar el texto
         return clean_ocr_text(text)
         
     except Exception as e:
-        logging.error(f"Error en OCR Tesseract para página {page.number + 1}: {e}")
-        return f"[ERROR CRÍTICO DE OCR EN PÁGINA {page.number + 1}]"
+        logging.error(f"Error en OCR Tesseract para página {page_number}: {e}")
+        return f"[ERROR CRÍTICO DE OCR EN PÁGINA {page_number}]"
+
+
+def is_ocr_failure(text: str) -> bool:
+    """Indica si ``text`` es uno de los marcadores de error de ``ocr_image``."""
+    return text.startswith(("[ERROR", "[OCR NO DISPONIBLE"))
+
+
+def _ocr_with_api(api: Any, img: Image.Image) -> str:
+    """
+    Ejecuta OCR con una instancia persistente de tesserocr.
+
+    Usa PSM 6 y, si no obtiene texto, reintenta con PSM 3 como ``ocr_image_bytes``.
+    """
+    api.SetImage(img)
+    text = api.GetUTF8Text()
+    if not text.strip():
+        # Intentar con configuración alternativa
+        api.SetPageSegMode(PSM.AUTO)
+        try:
+            api.SetImage(img)
+            text = api.GetUTF8Text()
+        finally:
+            api.SetPageSegMode(PSM.SINGLE_BLOCK)
+    return text
 
 
 def clean_ocr_text(text: str) -> str:
@@ -176,7 +455,7 @@ def clean_ocr_text(text: str) -> str:
                 continue
                 
             # Calcular ratio de caracteres alfabéticos
-            alphabetic_chars = sum(1 for c in line if c.isalpha())
+            alphabetic_chars = sum(map(str.isalpha, line))
             total_chars = len(line)
             
             if total_chars > 0:
@@ -265,10 +544,47 @@ def detect_lists(text: str) -> str:
     return "\n".join(output)
 
 
+@lru_cache(maxsize=1)
+def _load_manual_corrections(
+    path: str, mtime_ns: int, size: int
+) -> Optional[Tuple[re.Pattern, Dict[str, str]]]:
+    """
+    Compila las correcciones del CSV en una única expresión regular.
+
+    Memoizado por (ruta, mtime, tamaño): el archivo solo se vuelve a leer
+    cuando cambia.
+
+    Returns:
+        (patrón, corrección por forma incorrecta en minúsculas), o None si
+        el archivo no contiene correcciones
+    """
+    # Una sola entrada por forma incorrecta (sin distinguir mayúsculas): el
+    # archivo acumula filas repetidas y solo cuenta la primera.
+    unique: Dict[str, Tuple[str, str]] = {}
+    with open(path, newline="", encoding="utf-8") as fh:
+        for row in csv.DictReader(fh):
+            bad, good = row.get("ocr"), row.get("correct")
+            if not bad or good is None:
+                continue
+            unique.setdefault(bad.lower(), (bad, good))
+
+    if not unique:
+        return None
+
+    # Formas más largas primero: en una misma posición gana la coincidencia más larga
+    alternation = "|".join(
+        re.escape(bad) for bad, _ in sorted(unique.values(), key=lambda c: len(c[0]), reverse=True)
+    )
+    pattern = re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+    return pattern, {key: good for key, (_, good) in unique.items()}
+
+
 def apply_manual_corrections(text: str) -> str:
     """
     Aplica correcciones desde archivo CSV si existe.
     
+    Todas las correcciones se aplican en una sola pasada sobre el texto.
+
     Args:
         text: Texto a corregir
         
@@ -277,18 +593,19 @@ def apply_manual_corrections(text: str) -> str:
     """
     corrections_path = Path("data/corrections.csv")
     
-    if not corrections_path.exists():
+    try:
+        st = corrections_path.stat()
+    except OSError:
         return text
         
     try:
-        import csv
-        with corrections_path.open(newline="", encoding="utf-8") as fh:
-            reader = csv.DictReader(fh)
-            for row in reader:
-                if "ocr" in row and "correct" in row:
-                    bad, good = row["ocr"], row["correct"]
-                    # Reemplazo como palabra completa
-                    text = re.sub(rf"\b{re.escape(bad)}\b", good, text, flags=re.IGNORECASE)
+        compiled = _load_manual_corrections(str(corrections_path), st.st_mtime_ns, st.st_size)
+        if compiled is not None:
+            pattern, replacements = compiled
+            # Reemplazo como palabra completa
+            text = pattern.sub(
+                lambda m: replacements.get(m.group(0).lower(), m.group(0)), text
+            )
     except Exception as e:
         logging.error(f"Error aplicando correcciones manuales: {e}")
         
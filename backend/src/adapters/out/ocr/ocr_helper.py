@@ -23,23 +23,23 @@ def needs_ocr(page: fitz.Page) -> bool:
         # Criterios para determinar si necesita OCR:
         # 1. No hay texto o muy poco texto
         if len(text.strip()) < 50:
-            logger.debug(f"Página {page.number + 1} necesita OCR: texto insuficiente ({len(text)} caracteres)")
+            logger.debug("Página {} necesita OCR: texto insuficiente ({} caracteres)", page.number + 1, len(text))
             return True
             
         # 2. El texto contiene demasiados caracteres extraños o no válidos
         non_printable = sum(1 for c in text if not c.isprintable() and c not in "\n\t\r ")
         if non_printable > len(text) * 0.2:  # Si más del 20% son caracteres no imprimibles
-            logger.debug(f"Página {page.number + 1} necesita OCR: demasiados caracteres no imprimibles ({non_printable}/{len(text)})")
+            logger.debug("Página {} necesita OCR: demasiados caracteres no imprimibles ({}/{})", page.number + 1, non_printable, len(text))
             return True
             
         # 3. Alta proporción de caracteres inusuales o símbolos sospechosos
         unusual_chars = sum(1 for c in text if ord(c) > 127 and not re.match(r'[áéíóúüñÁÉÍÓÚÜÑ¿¡€£]', c))
         if unusual_chars > len(text) * 0.1:  # Si más del 10% son caracteres inusuales
-            logger.debug(f"Página {page.number + 1} necesita OCR: caracteres inusuales ({unusual_chars}/{len(text)})")
+            logger.debug("Página {} necesita OCR: caracteres inusuales ({}/{})", page.number + 1, unusual_chars, len(text))
             return True
             
         # No necesita OCR
-        logger.debug(f"Página {page.number + 1} no necesita OCR: texto extraíble de calidad")
+        logger.debug("Página {} no necesita OCR: texto extraíble de calidad", page.number + 1)
         return False
         
     except Exception as e:
@@ -1,21 +1,28 @@
 """
 Parallel OCR helper (pickle-safe).
 
-Each worker receives (pdf_path, page_index), opens the PDF locally,
-and runs perform_ocr_on_page on that single page.
+The document is split into contiguous page ranges, one per worker. Each
+worker receives (pdf_path, start, end), opens the PDF locally once and runs
+perform_ocr_on_pages on its range with a single Tesseract instance.
 """
 from concurrent.futures import ProcessPoolExecutor
+from math import ceil
 from pathlib import Path
+import os
 import fitz  # PyMuPDF
+from loguru import logger
 
-from .ocr_adapter import perform_ocr_on_page
+from .ocr_adapter import perform_ocr_on_pages
 
+# Tesseract ya usa varios hilos por proceso; ~4 núcleos por worker rinde mejor
+_CORES_PER_WORKER = 4
 
-def _ocr_single(args: tuple[str, int]) -> str:
-    pdf_path, page_idx = args
+
+def _ocr_page_range(args: tuple[str, int, int]) -> list[tuple[int, str]]:
+    pdf_path, start, end = args
     with fitz.open(pdf_path) as doc:
-        page = doc.load_page(page_idx)
-        return perform_ocr_on_page(page)
+        texts = perform_ocr_on_pages(doc.load_page(idx) for idx in range(start, end))
+    return list(zip(range(start, end), texts))
 
 
 def run_parallel(pdf_path: Path) -> list[str]:
@@ -27,20 +34,29 @@ def run_parallel(pdf_path: Path) -> list[str]:
     list[str]
         Texto OCR por página, en orden.
     """
-    from loguru import logger
-    
     pdf_path = str(pdf_path)  # asegurar serializable
     with fitz.open(pdf_path) as doc:
         total_pages = doc.page_count
-        indices = list(range(total_pages))
         logger.info(f"Iniciando procesamiento OCR paralelo de {total_pages} páginas")
 
-    results = []
-    with ProcessPoolExecutor() as pool:
-        futures = list(pool.map(_ocr_single, [(pdf_path, i) for i in indices]))
-        for i, text in enumerate(futures, 1):
-            results.append(text)
-            progress = (i / total_pages) * 100
-            logger.info(f"Progreso OCR: {progress:.1f}% ({i}/{total_pages} páginas)")
-    
-    return results
\ No newline at end of file
+    if total_pages == 0:
+        return []
+
+    workers = min(total_pages, max(1, (os.cpu_count() or 1) // _CORES_PER_WORKER))
+    seg_size = ceil(total_pages / workers)
+    vectors = [
+        (pdf_path, start, min(start + seg_size, total_pages))
+        for start in range(0, total_pages, seg_size)
+    ]
+
+    results: list[str] = [""] * total_pages
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for segment in pool.map(_ocr_page_range, vectors):
+            for idx, text in segment:
+                results[idx] = text
+            done += len(segment)
+            progress = (done / total_pages) * 100
+            logger.info(f"Progreso OCR: {progress:.1f}% ({done}/{total_pages} páginas)")
+
+    return results
@@ -15,15 +15,22 @@ serving as a bridge between domain logic and external libraries.
 
 from __future__ import annotations
 
+import hashlib
 import io
+import queue
+import threading
+from contextlib import ExitStack
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 from datetime import datetime
 from domain.ports.document_port import DocumentPort
 from domain.dtos.document_dtos import DocumentMetadataDTO
+from domain.ports.ocr_port import OCRPort
+from config.ocr_settings import OCRSettings
 from adapters.out.ocr import parallel_ocr
 import os
 import config.state as state
+from infrastructure.logging_setup import log_error_details
 
 # ──────── External imports ────────
 import camelot
@@ -34,15 +41,140 @@ from loguru import logger
 from tabulate import tabulate
 
 # ──────── Internal adapters ────────
-from adapters.out.ocr.ocr_adapter import needs_ocr, perform_ocr_on_page
+from adapters.out.ocr.ocr_adapter import (
+    DPI,
+    OCR_LANG,
+    good_direct_text,
+    is_ocr_failure,
+    lazy_tesseract_api,
+    needs_ocr,
+    ocr_image,
+    render_page_image,
+    render_page_pil,
+)
 
 # ──────── Configuración ────────
 _RENDER_DPI = 300
+# Páginas renderizadas que pueden esperar al OCR antes de frenar al productor
+_PIPELINE_DEPTH = 2
+_END_OF_PAGES = object()
 
 
 class PyMuPDFAdapter(DocumentPort):
     """Adapter that implements DocumentPort using PyMuPDF."""
 
+    def __init__(self, ocr_port: Optional[OCRPort] = None) -> None:
+        """
+        Args:
+            ocr_port: Motor OCR para páginas escaneadas. Si es None se usa el
+                indicado por ``OCRSettings.OCR_ENGINE`` (Tesseract por defecto).
+        """
+        if ocr_port is None and OCRSettings.OCR_ENGINE == "easyocr":
+            from adapters.out.ocr.easyocr_adapter import EasyOCRAdapter
+            ocr_port = EasyOCRAdapter(lang=OCRSettings.OCR_LANG)
+        self.ocr_port = ocr_port
+        self._segment_cache = None
+        self._page_cache = None
+        use_segments = ocr_port is None and OCRSettings.OCR_SEGMENT_CACHE
+        if use_segments or OCRSettings.OCR_PAGE_CACHE:
+            from infrastructure.ocr_cache import shared_ocr_cache
+            cache = shared_ocr_cache()
+            self._segment_cache = cache if use_segments else None
+            self._page_cache = cache if OCRSettings.OCR_PAGE_CACHE else None
+        # Motor y modo de OCR: forman parte de la clave de la caché de páginas
+        engine = type(ocr_port).__name__ if ocr_port is not None else "tesseract"
+        self._ocr_variant = f"{engine}{'-bands' if use_segments else ''}-{OCR_LANG}-{DPI}"
+
+    def _page_cache_key(self, page: fitz.Page) -> Optional[str]:
+        """
+        Calcula la clave de la caché de páginas sin renderizar la página.
+
+        Se obtiene del contenido crudo: geometría, flujo de contenido, streams
+        (aún comprimidos) de sus imágenes y XObjects, diccionarios de los
+        XObjects (recursos de formularios anidados) y fuentes usadas. Las
+        fuentes son necesarias: con subconjuntos que renumeran los glifos, dos
+        páginas con el mismo flujo de contenido pueden mostrar textos distintos.
+
+        Returns:
+            Clave de caché, o None si la caché está desactivada o falla el cálculo
+        """
+        if self._page_cache is None:
+            return None
+        try:
+            doc = page.parent
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(f"{tuple(page.rect)}|{page.rotation}".encode())
+            digest.update(page.read_contents())
+            image_xrefs = {img[0] for img in page.get_images(full=True)}
+            form_xrefs = {xobj[0] for xobj in page.get_xobjects()}
+            for xref in sorted(image_xrefs | form_xrefs):
+                digest.update(doc.xref_stream_raw(xref) or b"")
+            for xref in sorted(form_xrefs):
+                digest.update(doc.xref_object(xref, compressed=True).encode())
+            for xref in sorted({font[0] for font in page.get_fonts(full=True) if font[0] > 0}):
+                digest.update(doc.xref_object(xref, compressed=True).encode())
+                digest.update(doc.extract_font(xref)[-1] or b"")
+        except Exception as e:
+            logger.warning(f"No se pudo calcular la clave de caché de la página {page.number + 1}: {e}")
+            return None
+        return f"page-{self._ocr_variant}-{digest.hexdigest()}"
+
+    def _store_page_text(self, cache_key: Optional[str], text: str) -> None:
+        """Guarda el texto OCR de una página; los marcadores de error no se cachean."""
+        if cache_key is not None and not is_ocr_failure(text):
+            self._page_cache.set(cache_key, text)
+
+    def _ocr_page(
+        self, page: fitz.Page, page_num: int, get_api: Optional[Callable[[], Any]] = None
+    ) -> str:
+        """Renderiza y aplica OCR a una página, reutilizando la caché de páginas."""
+        cache_key = self._page_cache_key(page)
+        if cache_key is not None:
+            cached = self._page_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Página {page_num} recuperada de la caché de OCR")
+                return cached
+        text = self._ocr_image(self._render_for_ocr(page), page_num, get_api)
+        self._store_page_text(cache_key, text)
+        return text
+
+    def _render_for_ocr(self, page: fitz.Page):
+        """
+        Renderiza una página en el formato que espera el motor configurado.
+
+        Tesseract recibe la imagen PIL directamente (sin codificar ni
+        decodificar PNG); un ``ocr_port`` externo recibe bytes PNG.
+        """
+        if self.ocr_port is not None:
+            return render_page_image(page)
+        return render_page_pil(page)
+
+    def _ocr_image(
+        self, img_data, page_num: int, get_api: Optional[Callable[[], Any]] = None
+    ) -> str:
+        """
+        Aplica OCR a una página renderizada (PNG o imagen PIL) con el motor configurado.
+
+        Args:
+            img_data: Bytes PNG o imagen PIL de la página
+            page_num: Número de página (para los mensajes de error)
+            get_api: Devuelve la instancia de Tesseract a reutilizar; solo se
+                invoca cuando hace falta OCR con Tesseract (ver ``lazy_tesseract_api``)
+        """
+        if self.ocr_port is not None:
+            return self.ocr_port.extract_text(img_data)
+        api = get_api() if get_api is not None else None
+        if isinstance(img_data, bytes):
+            img = Image.open(io.BytesIO(img_data))
+        else:
+            img = img_data
+        if self._segment_cache is not None:
+            # Cabecera, cuerpo y pie por separado: las franjas repetidas salen de caché
+            return self._segment_cache.ocr_by_bands(
+                img, lambda band: ocr_image(band, page_num, api), should_cache=lambda t: not is_ocr_failure(t)
+            )
+        return ocr_image(img, page_num, api)
+
     def extract_pages(self, pdf_path: Path) -> List[str]:
         """
         Extrae el contenido de todas las páginas de un PDF.
@@ -72,33 +204,48 @@ class PyMuPDFAdapter(DocumentPort):
             with fitz.open(pdf_path) as doc:
                 logger.info(f"PDF abierto correctamente. Número de páginas: {doc.page_count}")
                 
-                for page_num, page in enumerate(doc, start=1):
-                    logger.info(f"Procesando página {page_num}/{doc.page_count}")
-                    
-                    try:
-                        # Intentar extraer texto directamente
-                        text = page.get_text()
-                        
-                        # Si la página necesita OCR
-                        if needs_ocr(page):
-                            logger.info(f"Página {page_num} requiere OCR")
-                            text = perform_ocr_on_page(page)
-                        else:
-                            logger.info(f"Página {page_num} procesada sin OCR")
-                        
-                        results.append(text)
-                    except Exception as e:
-                        logger.error(f"Error al procesar página {page_num}: {e}")
-                        from infrastructure.logging_setup import log_error_details
-                        log_error_details(e, f"Procesando página {page_num} de {pdf_path}")
-                        # Añadir texto de error a la página
-                        results.append(f"[ERROR EN PÁGINA {page_num}]: No se pudo extraer el texto correctamente.")
+                # Un hilo productor lee/renderiza páginas mientras este hilo ejecuta
+                # Tesseract; PyMuPDF solo se usa desde el productor.
+                pages_queue: queue.Queue = queue.Queue(maxsize=_PIPELINE_DEPTH)
+                stop = threading.Event()
+                producer = threading.Thread(
+                    target=self._produce_pages,
+                    args=(doc, pages_queue, stop),
+                    name="pdf-page-producer",
+                    daemon=True
+                )
+                producer.start()
+
+                try:
+                    # Tesseract solo se carga si alguna página llega como imagen
+                    with lazy_tesseract_api() as get_api:
+                        while True:
+                            item = pages_queue.get()
+                            if item is _END_OF_PAGES:
+                                break
+                            if isinstance(item, BaseException):
+                                raise item
+
+                            page_num, kind, payload, cache_key = item
+                            if kind == "image":
+                                payload = self._ocr_image(payload, page_num, get_api)
+                                self._store_page_text(cache_key, payload)
+                            results.append(payload)
+                finally:
+                    # Si el consumidor falla, el productor no debe quedar bloqueado
+                    # en put() ni seguir usando el documento tras cerrarlo
+                    stop.set()
+                    while producer.is_alive():
+                        try:
+                            pages_queue.get(timeout=0.1)
+                        except queue.Empty:
+                            pass
+                    producer.join()
                     
             return results
                     
         except Exception as e:
             logger.error(f"Error al extraer páginas del PDF: {e}")
-            from infrastructure.logging_setup import log_error_details
             log_error_details(e, f"Extracción de páginas de {pdf_path}")
             
             # Si falla el proceso normal, intentar con OCR paralelo como respaldo
@@ -110,6 +257,56 @@ class PyMuPDFAdapter(DocumentPort):
                 log_error_details(ocr_error, f"OCR paralelo en {pdf_path}")
                 return ["Error fatal: No se pudo procesar el documento. Consulte los logs para más detalles."]
 
+    def _produce_pages(
+        self, doc: fitz.Document, pages_queue: queue.Queue, stop: threading.Event
+    ) -> None:
+        """
+        Recorre el documento y encola el contenido de cada página.
+
+        Encola ``(page_num, "text", texto, None)`` para páginas con texto
+        embebido o ya presentes en la caché de OCR, y
+        ``(page_num, "image", imagen, clave_de_caché)`` para las que necesitan OCR.
+
+        Args:
+            doc: Documento PyMuPDF abierto
+            pages_queue: Cola acotada hacia el consumidor OCR
+            stop: Se activa cuando el consumidor deja de leer la cola
+        """
+        try:
+            for page_num, page in enumerate(doc, start=1):
+                if stop.is_set():
+                    return
+                logger.info(f"Procesando página {page_num}/{doc.page_count}")
+
+                try:
+                    # Si la página necesita OCR
+                    if needs_ocr(page):
+                        logger.info(f"Página {page_num} requiere OCR")
+                        text = good_direct_text(page)
+                        if text is None:
+                            cache_key = self._page_cache_key(page)
+                            if cache_key is not None:
+                                text = self._page_cache.get(cache_key)
+                            if text is None:
+                                pages_queue.put((page_num, "image", self._render_for_ocr(page), cache_key))
+                                continue
+                            logger.info(f"Página {page_num} recuperada de la caché de OCR")
+                    else:
+                        # Extraer texto directamente
+                        text = page.get_text()
+                        logger.info(f"Página {page_num} procesada sin OCR")
+                except Exception as e:
+                    logger.error(f"Error al procesar página {page_num}: {e}")
+                    log_error_details(e, f"Procesando página {page_num} de {doc.name}")
+                    # Añadir texto de error a la página
+                    text = f"[ERROR EN PÁGINA {page_num}]: No se pudo extraer el texto correctamente."
+
+                pages_queue.put((page_num, "text", text, None))
+        except BaseException as e:
+            pages_queue.put(e)
+        else:
+            pages_queue.put(_END_OF_PAGES)
+
     def extract_tables(self, pdf_path: Path) -> List[Tuple[int, str]]:
         """
         Extrae todas las tablas encontradas en el PDF.
@@ -121,12 +318,13 @@ class PyMuPDFAdapter(DocumentPort):
             List[Tuple[int, str]]: Lista de (número_página, tabla_markdown)
         """
         tables: List[Tuple[int, str]] = []
+        # pdfplumber se abre una sola vez, en la primera página que lo necesite
+        pdf_pl = None
         
         try:
-            with fitz.open(pdf_path) as doc:
+            with fitz.open(pdf_path) as doc, ExitStack() as stack:
                 for page_num, page in enumerate(doc, 1):
-                    pix = page.get_pixmap(dpi=_RENDER_DPI, alpha=False)
-                    img = Image.open(io.BytesIO(pix.tobytes("png")))
+                    img = render_page_pil(page, _RENDER_DPI)
 
                     if not self._has_visual_table(img):
                         continue
@@ -143,12 +341,14 @@ class PyMuPDFAdapter(DocumentPort):
 
                     # Si Camelot falla, intentar con pdfplumber
                     try:
-                        with pdfplumber.open(pdf_path) as pdf_pl:
-                            pg = pdf_pl.pages[page_num - 1]
-                            tbls = pg.extract_tables()
-                            if tbls:
-                                for tbl in tbls:
-                                    tables.append((page_num, tabulate(tbl, tablefmt='pipe')))
+                        if pdf_pl is None:
+                            pdf_pl = stack.enter_context(pdfplumber.open(pdf_path))
+                        pg = pdf_pl.pages[page_num - 1]
+                        tbls = pg.extract_tables()
+                        pg.close()  # Libera la caché de objetos de la página
+                        if tbls:
+                            for tbl in tbls:
+                                tables.append((page_num, tabulate(tbl, tablefmt='pipe')))
                     except Exception:
                         pass
 
@@ -173,16 +373,19 @@ class PyMuPDFAdapter(DocumentPort):
             if not pages:
                 raise ValueError("No se pudo extraer texto del PDF")
             
-            # Convertir a Markdown
-            md_out = ""
+            # Convertir a Markdown: las piezas se unen una sola vez al final, sin
+            # copiar el documento acumulado en cada página
+            if len(pages) == 1:
+                return pages[0].strip()
+
+            # Solo agregar encabezado si hay más de una página
+            md_parts = []
             for i, text in enumerate(pages, 1):
-                # Solo agregar encabezado si hay más de una página
-                if len(pages) > 1:
-                    md_out += f"\n## Página {i}\n\n"
-                    
-                md_out += text + "\n\n"
+                md_parts.append(f"\n## Página {i}\n\n")
+                md_parts.append(text)
+                md_parts.append("\n\n")
             
-            return md_out.strip()
+            return "".join(md_parts).strip()
             
         except Exception as e:
             logger.error(f"Error extracting markdown: {e}")
@@ -279,19 +482,20 @@ class PyMuPDFAdapter(DocumentPort):
         """
         md_parts: List[str] = []
         logger.info("Fase 2/3: Iniciando detección y extracción de tablas")
+        # pdfplumber se abre una sola vez, en la primera página que lo necesite
+        pdf_pl = None
 
         try:
-            with fitz.open(pdf_path) as doc:
+            with fitz.open(pdf_path) as doc, ExitStack() as stack:
                 total_pages = doc.page_count
                 tables_found = 0
                 
                 for page_num, page in enumerate(doc, start=1):
                     logger.info(f"Analizando página {page_num}/{total_pages} para tablas...")
-                    pix = page.get_pixmap(dpi=_RENDER_DPI, alpha=False)
-                    img = Image.open(io.BytesIO(pix.tobytes("png")))
+                    img = render_page_pil(page, _RENDER_DPI)
 
                     if not self._has_visual_table(img):
-                        logger.debug(f"[Page {page_num}] No se detectaron estructuras de tabla")
+                        logger.debug("[Page {}] No se detectaron estructuras de tabla", page_num)
                         continue
 
                     logger.info(f"[Page {page_num}] Se detectó estructura de tabla")
@@ -321,7 +525,7 @@ class PyMuPDFAdapter(DocumentPort):
                     try:
                         tables = camelot.read_pdf(str(pdf_path), pages=str(page_num), flavor="lattice")
                         if tables.n == 0:
-                            logger.debug(f"[Page {page_num}] lattice found none — trying stream")
+                            logger.debug("[Page {}] lattice found none — trying stream", page_num)
                             tables = camelot.read_pdf(str(pdf_path), pages=str(page_num), flavor="stream")
                         if tables.n:
                             md_parts.append(f"## Tables (Camelot · page {page_num})\n")
@@ -332,15 +536,17 @@ class PyMuPDFAdapter(DocumentPort):
                         logger.warning(f"[Page {page_num}] Camelot error → {exc}")
 
                     try:
-                        with pdfplumber.open(pdf_path) as pdf_pl:
-                            pg = pdf_pl.pages[page_num - 1]
-                            tbls = pg.extract_tables()
-                            if tbls:
-                                md_parts.append(f"## Tables (pdfplumber · page {page_num})\n")
-                                for idx, tbl in enumerate(tbls, start=1):
-                                    md_parts.append(
-                                        f"### Table {idx}\n\n{tabulate(tbl, tablefmt='pipe')}\n"
-                                    )
+                        if pdf_pl is None:
+                            pdf_pl = stack.enter_context(pdfplumber.open(pdf_path))
+                        pg = pdf_pl.pages[page_num - 1]
+                        tbls = pg.extract_tables()
+                        pg.close()  # Libera la caché de objetos de la página
+                        if tbls:
+                            md_parts.append(f"## Tables (pdfplumber · page {page_num})\n")
+                            for idx, tbl in enumerate(tbls, start=1):
+                                md_parts.append(
+                                    f"### Table {idx}\n\n{tabulate(tbl, tablefmt='pipe')}\n"
+                                )
                     except Exception as exc:
                         logger.warning(f"[Page {page_num}] pdfplumber error → {exc}")
 
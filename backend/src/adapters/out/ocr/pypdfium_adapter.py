@@ -0,0 +1,83 @@
+"""
+Text-extraction adapter backed by pypdfium2.
+
+• Extracts embedded text with PDFium, which is considerably faster than
+  PyMuPDF for plain text and is not serialised behind MuPDF's global lock.
+• Pages without usable selectable text are still rendered and OCR'd through
+  PyMuPDF (see ``ocr_adapter``).
+• Tables, metadata and Markdown assembly are inherited from
+  ``PyMuPDFAdapter`` so this class is a drop-in ``DocumentPort``.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+import fitz
+import pypdfium2 as pdfium
+from loguru import logger
+
+from adapters.out.ocr.ocr_adapter import (
+    good_direct_text,
+    lazy_tesseract_api,
+    needs_ocr,
+    text_needs_ocr,
+)
+from adapters.out.ocr.pymupdf_adapter import PyMuPDFAdapter
+
+
+class PypdfiumDocumentAdapter(PyMuPDFAdapter):
+    """Adapter that implements DocumentPort using pypdfium2 for text extraction."""
+
+    def extract_pages(self, pdf_path: Path) -> List[str]:
+        """
+        Extrae el contenido de todas las páginas de un PDF con PDFium.
+        Las páginas sin texto seleccionable, o cuyo texto es ilegible (ver
+        ``text_needs_ocr``), se procesan con OCR.
+
+        Args:
+            pdf_path: Ruta al archivo PDF
+
+        Returns:
+            List[str]: Lista de contenido por página
+        """
+        if not pdf_path.exists():
+            logger.error(f"El archivo no existe: {pdf_path}")
+            raise FileNotFoundError(f"El archivo no existe: {pdf_path}")
+
+        try:
+            pdf = pdfium.PdfDocument(str(pdf_path))
+        except Exception as e:
+            logger.warning(f"PDFium no pudo abrir {pdf_path}, usando PyMuPDF: {e}")
+            return super().extract_pages(pdf_path)
+
+        results: List[str] = []
+        ocr_pages: List[int] = []
+        try:
+            logger.info(f"PDF abierto con PDFium. Número de páginas: {len(pdf)}")
+            for idx in range(len(pdf)):
+                textpage = pdf[idx].get_textpage()
+                text = textpage.get_text_range().replace("\r\n", "\n")
+                # Mismo criterio que PyMuPDFAdapter: poco texto o texto ilegible
+                if text_needs_ocr(text):
+                    ocr_pages.append(idx)
+                results.append(text)
+        finally:
+            pdf.close()
+
+        if ocr_pages:
+            with fitz.open(pdf_path) as doc, lazy_tesseract_api() as get_api:
+                for idx in ocr_pages:
+                    page = doc.load_page(idx)
+                    if needs_ocr(page):
+                        logger.info(f"Página {idx + 1} requiere OCR")
+                        text = good_direct_text(page)
+                        if text is None:
+                            text = self._ocr_page(page, idx + 1, get_api)
+                    else:
+                        # PyMuPDF extrae un texto utilizable donde PDFium no
+                        text = page.get_text()
+                    results[idx] = text
+
+        return results
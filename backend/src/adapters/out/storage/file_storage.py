@@ -13,16 +13,26 @@ de archivos.
 """
 import json
 from datetime import datetime
-"""
-Implementación del puerto de almacenamiento usando el sistema de archivos.
-Maneja las operaciones de lectura/escritura de archivos y directorios.
-"""
+# Implementación del puerto de almacenamiento usando el sistema de archivos.
+# Maneja las operaciones de lectura/escritura de archivos y directorios.
+import atexit
+import itertools
+import os
+import tempfile
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
 from domain.ports.storage_port import StoragePort
 from domain.ports.storage_port import StoragePort
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Directorios de trabajo
 OUTPUT_DIR = Path("resultado")
 LOGS_DIR = Path("logs")
@@ -32,6 +42,106 @@ CONVERSATIONS_DIR = LOGS_DIR / "conversations"
 # Estructura de una conversación
 Conversation = List[Dict[str, str]]
 
+# Tamaño de bloque para escrituras grandes (acota la presión sobre la caché de páginas)
+_WRITE_CHUNK = 1 << 20
+
+# Descriptor del log diario de llamadas a la API: (ruta, fd), abierto en modo append
+_API_LOG_LOCK = threading.Lock()
+_api_log: Optional[Tuple[Path, int]] = None
+
+# Contador por proceso para identificadores de log únicos sin depender del reloj
+_log_ctr = itertools.count()
+
+
+@lru_cache(maxsize=32)
+def _ensure_dir(directory: Path) -> Path:
+    """Crea *directory* solo la primera vez que se solicita en el proceso."""
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _write_bytes(output_path: Path, data: bytes) -> None:
+    """
+    Escribe *data* de forma atómica, en bloques de 1 MiB.
+
+    Se escribe un archivo temporal junto al destino y se renombra con
+    ``os.replace``, de modo que nunca queda un Markdown a medio escribir.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp"
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        try:
+            if hasattr(os, "fchmod"):
+                # mkstemp crea el archivo con 0o600; el Markdown debe ser legible
+                os.fchmod(fd, 0o644)
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view[:_WRITE_CHUNK])
+                view = view[written:]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_encoded(output_path: Path, data: bytes) -> None:
+    """Escribe *data*; si el directorio se borró tras crearlo, lo recrea."""
+    try:
+        _write_bytes(output_path, data)
+    except FileNotFoundError:
+        _ensure_dir.cache_clear()
+        _ensure_dir(output_path.parent)
+        _write_bytes(output_path, data)
+
+
+def _write_text(output_path: Path, content: str) -> None:
+    """Escribe *content* codificado en UTF-8."""
+    _write_encoded(output_path, content.encode("utf-8"))
+
+
+def _json_line(data: Dict[str, Any]) -> bytes:
+    """Serializa *data* como una línea JSON (UTF-8, terminada en salto de línea)."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+    return (json.dumps(data, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def _append_api_log(day: str, line: bytes) -> Path:
+    """Añade *line* al log JSONL del día, reutilizando el descriptor abierto."""
+    global _api_log
+    log_file = API_LOGS_DIR / f"api_calls_{day}.jsonl"
+    with _API_LOG_LOCK:
+        if _api_log is None or _api_log[0] != log_file:
+            if _api_log is not None:
+                os.close(_api_log[1])
+            _ensure_dir(API_LOGS_DIR)
+            fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            _api_log = (log_file, fd)
+        os.write(_api_log[1], line)
+    return log_file
+
+
+def _close_api_log() -> None:
+    global _api_log
+    with _API_LOG_LOCK:
+        if _api_log is not None:
+            os.close(_api_log[1])
+            _api_log = None
+
+
+atexit.register(_close_api_log)
+
 
 class FileStorage(StoragePort):
     """Implementación de StoragePort usando el sistema de archivos."""
@@ -40,6 +150,9 @@ class FileStorage(StoragePort):
         """
         Guarda el contenido extraído y convertido en un archivo Markdown.
 
+        La escritura es síncrona: al retornar, el archivo ya existe en disco y
+        cualquier error de E/S se propaga al llamador.
+
         Args:
             stem: Nombre base del archivo (sin extensión)
             markdown: Contenido en formato Markdown
@@ -47,9 +160,12 @@ class FileStorage(StoragePort):
         Returns:
             Path: Ruta al archivo guardado
         """
-        self.ensure_directory(OUTPUT_DIR)
-        output_path = OUTPUT_DIR / f"{stem}.md"
-        output_path.write_text(markdown, encoding="utf-8")
+        output_path = _ensure_dir(OUTPUT_DIR) / f"{stem}.md"
+        try:
+            _write_text(output_path, markdown)
+        except Exception as e:
+            logger.error(f"Error al guardar {output_path}: {e}")
+            raise
         logger.info(f"Archivo Markdown guardado: {output_path}")
         return output_path
 
@@ -78,7 +194,7 @@ class FileStorage(StoragePort):
         """
         try:
             directory.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Directorio asegurado: {directory}")
+            logger.debug("Directorio asegurado: {}", directory)
         except Exception as e:
             logger.error(f"Error al crear directorio {directory}: {e}")
             raise
@@ -114,6 +230,9 @@ def log_api_interaction(
     """
     Guarda un registro detallado de la interacción con la API de OpenAI.
 
+    Cada llamada se añade como una línea al archivo diario
+    ``api_calls_YYYYMMDD.jsonl``.
+
     Args:
         model: El modelo usado (ej: 'gpt-4', 'gpt-3.5-turbo')
         messages: Lista de mensajes enviados a la API
@@ -122,16 +241,14 @@ def log_api_interaction(
         conversation_id: ID de la conversación si es parte de una secuencia
 
     Returns:
-        Path: Ruta al archivo de log generado
+        Path: Ruta al archivo de log del día
     """
-    API_LOGS_DIR.mkdir(parents=True, exist_ok=True)
-    
-    # Crear nombre de archivo con timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = API_LOGS_DIR / f"api_call_{timestamp}.json"
+    call_id = f"{time.time_ns()}_{next(_log_ctr)}"
     
     # Preparar datos del log
     log_data = {
+        "id": call_id,
         "timestamp": timestamp,
         "model": model,
         "messages": messages,
@@ -150,8 +267,8 @@ def log_api_interaction(
         log_data["response"] = response.model_dump() if hasattr(response, 'model_dump') else str(response)
     
     # Guardar log
-    log_file.write_text(json.dumps(log_data, indent=2, ensure_ascii=False), encoding="utf-8")
-    logger.debug(f"Log de API guardado en {log_file}")
+    log_file = _append_api_log(timestamp[:8], _json_line(log_data))
+    logger.debug("Log de API guardado en {}", log_file)
     
     # Si es parte de una conversación, actualizar el historial
     if conversation_id and not error:
@@ -163,20 +280,31 @@ def load_conversation(conversation_id: str) -> Optional[Conversation]:
     """
     Carga el historial de una conversación existente.
     
+    El historial se guarda como JSON Lines (un mensaje por línea); los
+    historiales antiguos en un único ``.json`` se siguen pudiendo leer.
+
     Args:
         conversation_id: Identificador único de la conversación
     
     Returns:
         Optional[Conversation]: Lista de mensajes de la conversación o None si no existe
     """
-    CONVERSATIONS_DIR.mkdir(parents=True, exist_ok=True)
-    conv_file = CONVERSATIONS_DIR / f"{conversation_id}.json"
+    conv_file = CONVERSATIONS_DIR / f"{conversation_id}.jsonl"
     
-    if not conv_file.exists():
+    try:
+        with open(conv_file, "rb") as fh:
+            return [json.loads(line) for line in fh if line.strip()]
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"Error al cargar conversación {conversation_id}: {e}")
         return None
-        
+
+    legacy_file = CONVERSATIONS_DIR / f"{conversation_id}.json"
     try:
-        return json.loads(conv_file.read_text(encoding="utf-8"))
+        return json.loads(legacy_file.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
     except Exception as e:
         logger.error(f"Error al cargar conversación {conversation_id}: {e}")
         return None
@@ -189,29 +317,31 @@ def update_conversation_history(
     """
     Actualiza el historial de una conversación con nuevos mensajes.
     
+    Solo se añaden al final del archivo los mensajes nuevos, sin reescribir
+    el historial previo.
+
     Args:
         conversation_id: Identificador único de la conversación
         new_messages: Nuevos mensajes a agregar
         response: Respuesta de la API
     """
-    CONVERSATIONS_DIR.mkdir(parents=True, exist_ok=True)
-    conv_file = CONVERSATIONS_DIR / f"{conversation_id}.json"
+    conv_file = _ensure_dir(CONVERSATIONS_DIR) / f"{conversation_id}.jsonl"
     
-    # Cargar historial existente o crear nuevo
-    history = load_conversation(conversation_id) or []
+    # Migrar un historial antiguo (.json) la primera vez que se amplía
+    messages: Conversation = []
+    if not conv_file.exists():
+        messages.extend(load_conversation(conversation_id) or [])
     
     # Agregar nuevos mensajes
-    history.extend(new_messages)
+    messages.extend(new_messages)
     
     # Agregar respuesta del asistente
     if hasattr(response, 'choices') and response.choices:
-        history.append({
+        messages.append({
             "role": "assistant",
             "content": response.choices[0].message.content
         })
     
-    # Guardar historial actualizado
-    conv_file.write_text(
-        json.dumps(history, indent=2, ensure_ascii=False),
-        encoding="utf-8"
-    )
\ No newline at end of file
+    # Añadir al historial
+    with open(conv_file, "ab") as fh:
+        fh.write(b"".join(_json_line(message) for message in messages))
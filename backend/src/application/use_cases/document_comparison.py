@@ -6,12 +6,71 @@ mostrando cambios en texto, estructura y contenido.
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import difflib
-import re
+import io
+import hashlib
 
 from domain.ports.document_port import DocumentPort
 from domain.ports.storage_port import StoragePort
 from domain.dtos.document_dtos import DocumentComparisonDTO, DocumentDiffDTO
 
+
+def _format_range(start: int, stop: int) -> str:
+    """Formatea un rango de líneas como en ``difflib.unified_diff``."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _file_digest(path: Path) -> bytes:
+    """Calcula el hash BLAKE2 de un archivo leyéndolo por bloques."""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).digest()
+
+
+def _same_file_content(a: Path, b: Path) -> bool:
+    """Indica si dos archivos tienen exactamente el mismo contenido."""
+    try:
+        if a.stat().st_size != b.stat().st_size:
+            return False
+        return _file_digest(a) == _file_digest(b)
+    except OSError:
+        # Dejar que la extracción normal reporte el problema
+        return False
+
+
+def _format_date(value) -> str:
+    """Formatea una fecha de metadatos para el informe."""
+    return value.isoformat() if value else "None"
+
+
+def _diff_metadata(a, b) -> Dict[str, Tuple[str, str]]:
+    """Compara los campos de metadatos conocidos con accesos directos a atributos."""
+    changes = {}
+
+    # Atributos comunes
+    if a.title != b.title:
+        changes['title'] = (str(a.title), str(b.title))
+    if a.author != b.author:
+        changes['author'] = (str(a.author), str(b.author))
+    if a.producer != b.producer:
+        changes['producer'] = (str(a.producer), str(b.producer))
+
+    # Fechas
+    if a.creation_date != b.creation_date:
+        changes['creation_date'] = (_format_date(a.creation_date), _format_date(b.creation_date))
+    if a.modification_date != b.modification_date:
+        changes['modification_date'] = (
+            _format_date(a.modification_date),
+            _format_date(b.modification_date)
+        )
+
+    return changes
+
+
 class DocumentComparisonUseCase:
     """Caso de uso para comparar diferentes versiones de documentos."""
     
@@ -45,26 +104,36 @@ class DocumentComparisonUseCase:
         Returns:
             DTO con resultados de la comparación
         """
-        # Extraer contenido de ambos documentos
-        original_pages = self.document_port.extract_pages(original_pdf_path)
-        new_pages = self.document_port.extract_pages(new_pdf_path)
-
-        # Extraer metadatos
-        original_metadata = self.document_port.extract_metadata(original_pdf_path)
-        new_metadata = self.document_port.extract_metadata(new_pdf_path)
-
-        # Comparar contenido página por página
-        page_diffs = self._compare_pages(original_pages, new_pages)
-
-        # Generar informe de diferencias
-        comparison_result = DocumentComparisonDTO(
-            original_path=str(original_pdf_path),
-            new_path=str(new_pdf_path),
-            original_pages=len(original_pages),
-            new_pages=len(new_pages),
-            page_differences=page_diffs,
-            metadata_changes=self._compare_metadata(original_metadata, new_metadata)
-        )
+        if _same_file_content(original_pdf_path, new_pdf_path):
+            # Archivos idénticos: basta con el número de páginas, sin extraer texto
+            page_count = self.document_port.extract_metadata(original_pdf_path).page_count
+            comparison_result = DocumentComparisonDTO(
+                original_path=str(original_pdf_path),
+                new_path=str(new_pdf_path),
+                original_pages=page_count,
+                new_pages=page_count
+            )
+        else:
+            # Extraer contenido de ambos documentos
+            original_pages = self.document_port.extract_pages(original_pdf_path)
+            new_pages = self.document_port.extract_pages(new_pdf_path)
+
+            # Extraer metadatos
+            original_metadata = self.document_port.extract_metadata(original_pdf_path)
+            new_metadata = self.document_port.extract_metadata(new_pdf_path)
+
+            # Comparar contenido página por página
+            page_diffs = self._compare_pages(original_pages, new_pages)
+
+            # Generar informe de diferencias
+            comparison_result = DocumentComparisonDTO(
+                original_path=str(original_pdf_path),
+                new_path=str(new_pdf_path),
+                original_pages=len(original_pages),
+                new_pages=len(new_pages),
+                page_differences=page_diffs,
+                metadata_changes=self._compare_metadata(original_metadata, new_metadata)
+            )
 
         # Guardar informe si se especificó una ruta
         if output_path:
@@ -102,16 +171,34 @@ class DocumentComparisonUseCase:
             if original_content == new_content:
                 continue
 
-            # Calcular diferencias usando difflib
-            diff = list(difflib.ndiff(
-                self._normalize_text(original_content).splitlines(),
-                self._normalize_text(new_content).splitlines()
-            ))
+            original_text = self._normalize_text(original_content)
+            new_text = self._normalize_text(new_content)
 
-            # Contar cambios
-            additions = len([line for line in diff if line.startswith('+ ')])
-            deletions = len([line for line in diff if line.startswith('- ')])
-            changes = len([line for line in diff if line.startswith('? ')])
+            # Si solo difieren en espacios, no hace falta el diff
+            if original_text == new_text:
+                continue
+
+            original_lines = original_text.splitlines()
+            new_lines = new_text.splitlines()
+
+            # Calcular diferencias con SequenceMatcher (más rápido que ndiff)
+            matcher = difflib.SequenceMatcher(a=original_lines, b=new_lines, autojunk=False)
+
+            # Contar cambios en una sola pasada sobre los opcodes
+            additions = deletions = changes = 0
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                if tag == 'insert':
+                    additions += j2 - j1
+                elif tag == 'delete':
+                    deletions += i2 - i1
+                elif tag == 'replace':
+                    additions += j2 - j1
+                    deletions += i2 - i1
+                    changes += 1
+
+            diff_text = ""
+            if (additions + deletions + changes) > 0:
+                diff_text = self._format_unified_diff(matcher, original_lines, new_lines)
 
             # Crear DTO de diferencias para esta página
             page_diff = DocumentDiffDTO(
@@ -119,13 +206,51 @@ class DocumentComparisonUseCase:
                 additions=additions,
                 deletions=deletions,
                 changes=changes,
-                diff_text="\n".join(diff) if (additions + deletions + changes) > 0 else ""
+                diff_text=diff_text
             )
 
             result.append(page_diff)
 
         return result
 
+    def _format_unified_diff(
+        self,
+        matcher: difflib.SequenceMatcher,
+        original_lines: List[str],
+        new_lines: List[str],
+        context: int = 3
+    ) -> str:
+        """Genera un diff unificado reutilizando los opcodes ya calculados.
+
+        ``difflib.unified_diff`` construye su propio ``SequenceMatcher`` y
+        volvería a comparar las líneas; aquí se reaprovecha el existente.
+
+        Args:
+            matcher: Comparador ya aplicado a ambas versiones
+            original_lines: Líneas normalizadas del original
+            new_lines: Líneas normalizadas de la versión nueva
+            context: Líneas de contexto alrededor de cada cambio
+
+        Returns:
+            Diff en formato unificado
+        """
+        out = ["--- original", "+++ nuevo"]
+        for group in matcher.get_grouped_opcodes(context):
+            first, last = group[0], group[-1]
+            out.append(
+                f"@@ -{_format_range(first[1], last[2])} "
+                f"+{_format_range(first[3], last[4])} @@"
+            )
+            for tag, i1, i2, j1, j2 in group:
+                if tag == 'equal':
+                    out.extend(' ' + line for line in original_lines[i1:i2])
+                    continue
+                if tag in ('replace', 'delete'):
+                    out.extend('-' + line for line in original_lines[i1:i2])
+                if tag in ('replace', 'insert'):
+                    out.extend('+' + line for line in new_lines[j1:j2])
+        return "\n".join(out)
+
     def _compare_metadata(
         self,
         original_metadata,
@@ -140,27 +265,7 @@ class DocumentComparisonUseCase:
         Returns:
             Diccionario con cambios en metadatos
         """
-        changes = {}
-
-        # Comparar atributos comunes
-        for attr in ['title', 'author', 'producer']:
-            original_value = getattr(original_metadata, attr, None)
-            new_value = getattr(new_metadata, attr, None)
-
-            if original_value != new_value:
-                changes[attr] = (str(original_value), str(new_value))
-
-        # Comparar fechas
-        for attr in ['creation_date', 'modification_date']:
-            original_date = getattr(original_metadata, attr, None)
-            new_date = getattr(new_metadata, attr, None)
-
-            if original_date != new_date:
-                original_str = original_date.isoformat() if original_date else "None"
-                new_str = new_date.isoformat() if new_date else "None"
-                changes[attr] = (original_str, new_str)
-
-        return changes
+        return _diff_metadata(original_metadata, new_metadata)
 
     def _normalize_text(self, text: str) -> str:
         """Normaliza el texto para comparación más precisa.
@@ -171,13 +276,8 @@ class DocumentComparisonUseCase:
         Returns:
             Texto normalizado
         """
-        # Eliminar espacios en blanco múltiples
-        text = re.sub(r'\s+', ' ', text)
-
-        # Eliminar espacios al inicio y final de líneas
-        text = re.sub(r'^\s+|\s+$', '', text, flags=re.MULTILINE)
-
-        return text.strip()
+        # Colapsar espacios múltiples y recortar extremos de cada línea en una pasada
+        return "\n".join(" ".join(line.split()) for line in text.splitlines()).strip()
 
     def _generate_markdown_report(self, comparison: DocumentComparisonDTO) -> str:
         """Genera un informe en formato Markdown con los resultados de la comparación.
@@ -188,41 +288,46 @@ class DocumentComparisonUseCase:
         Returns:
             Informe en formato Markdown
         """
-        lines = []
+        buf = io.StringIO()
+
+        def w(line: str) -> None:
+            buf.write(line)
+            buf.write("\n")
 
         # Encabezado
-        lines.append("# Informe de Comparación de Documentos\n")
-        lines.append("## Resumen\n")
-        lines.append(f"- **Documento Original**: {comparison.original_path}")
-        lines.append(f"- **Documento Nuevo**: {comparison.new_path}")
-        lines.append(f"- **Páginas Original**: {comparison.original_pages}")
-        lines.append(f"- **Páginas Nuevo**: {comparison.new_pages}")
-        lines.append(f"- **Páginas con Diferencias**: {len(comparison.page_differences)}\n")
+        w("# Informe de Comparación de Documentos\n")
+        w("## Resumen\n")
+        w(f"- **Documento Original**: {comparison.original_path}")
+        w(f"- **Documento Nuevo**: {comparison.new_path}")
+        w(f"- **Páginas Original**: {comparison.original_pages}")
+        w(f"- **Páginas Nuevo**: {comparison.new_pages}")
+        w(f"- **Páginas con Diferencias**: {len(comparison.page_differences)}\n")
 
         # Cambios en metadatos
         if comparison.metadata_changes:
-            lines.append("## Cambios en Metadatos\n")
-            lines.append("| Campo | Valor Original | Valor Nuevo |")
-            lines.append("| ----- | -------------- | ----------- |")
+            w("## Cambios en Metadatos\n")
+            w("| Campo | Valor Original | Valor Nuevo |")
+            w("| ----- | -------------- | ----------- |")
 
             for field, (original, new) in comparison.metadata_changes.items():
-                lines.append(f"| {field} | {original} | {new} |")
+                w(f"| {field} | {original} | {new} |")
 
-            lines.append("\n")
+            w("\n")
 
         # Diferencias por página
         if comparison.page_differences:
-            lines.append("## Diferencias por Página\n")
+            w("## Diferencias por Página\n")
 
             for diff in comparison.page_differences:
-                lines.append(f"### Página {diff.page_number}\n")
-                lines.append(f"- **Adiciones**: {diff.additions}")
-                lines.append(f"- **Eliminaciones**: {diff.deletions}")
-                lines.append(f"- **Cambios**: {diff.changes}\n")
+                w(f"### Página {diff.page_number}\n")
+                w(f"- **Adiciones**: {diff.additions}")
+                w(f"- **Eliminaciones**: {diff.deletions}")
+                w(f"- **Cambios**: {diff.changes}\n")
 
                 if diff.diff_text:
-                    lines.append("```diff")
-                    lines.append(diff.diff_text)
-                    lines.append("```\n")
+                    w("```diff")
+                    w(diff.diff_text)
+                    w("```\n")
 
-        return "\n".join(lines)
\ No newline at end of file
+        # Sin el separador final, igual que "\n".join(...)
+        return buf.getvalue()[:-1]
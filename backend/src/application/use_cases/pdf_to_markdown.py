@@ -4,11 +4,20 @@ Caso de uso para convertir archivos PDF a formato Markdown.
 Este módulo implementa la lógica de negocio para convertir documentos PDF a formato Markdown,
 utilizando OCR cuando es necesario y refinando el texto con LLM.
 """
+import hashlib
 from pathlib import Path
-from typing import Protocol
+from typing import TYPE_CHECKING, Optional, Protocol
 from domain.ports.document_port import DocumentPort
 from domain.ports.storage_port import StoragePort
 from domain.ports.llm_port import LLMPort
+from infrastructure.logging_setup import logger, log_error_details
+
+if TYPE_CHECKING:
+    from infrastructure.markdown_cache import MarkdownCache
+
+# Versión del Markdown cacheado: incrementarla cuando cambie la extracción o el
+# ensamblado del documento, para que no se sirvan resultados de la versión anterior
+MARKDOWN_CACHE_VERSION = 1
 
 class PDFToMarkdownUseCase:
     """Caso de uso para la conversión de PDF a Markdown."""
@@ -17,7 +26,8 @@ class PDFToMarkdownUseCase:
         self,
         document_port: DocumentPort,
         storage_port: StoragePort,
-        llm_port: LLMPort
+        llm_port: LLMPort,
+        markdown_cache: Optional["MarkdownCache"] = None
     ):
         """
         Inicializa el caso de uso con sus dependencias.
@@ -26,10 +36,25 @@ class PDFToMarkdownUseCase:
             document_port: Puerto para operaciones con documentos
             storage_port: Puerto para almacenamiento
             llm_port: Puerto para refinamiento con LLM
+            markdown_cache: Caché opcional de resultados por contenido del PDF
         """
         self.document_port = document_port
         self.storage_port = storage_port
         self.llm_port = llm_port
+        self.markdown_cache = markdown_cache
+
+    def _cache_variant(self) -> str:
+        """
+        Identifica el modo de procesamiento para separar entradas de caché.
+
+        Combina la versión del formato de salida con la configuración del LLM
+        (proveedor, modelo, modo y prompt cuando el puerto la expone).
+        """
+        if self.llm_port is None:
+            return f"v{MARKDOWN_CACHE_VERSION}-raw"
+        variant = getattr(self.llm_port, "cache_variant", None) or type(self.llm_port).__name__
+        digest = hashlib.blake2b(variant.encode("utf-8"), digest_size=8).hexdigest()
+        return f"v{MARKDOWN_CACHE_VERSION}-{digest}"
 
     def execute(self, pdf_path: Path) -> Path:
         """
@@ -47,8 +72,6 @@ class PDFToMarkdownUseCase:
             StorageError: Si hay problemas al guardar el resultado
             LLMError: Si hay problemas con el refinamiento del texto
         """
-        from infrastructure.logging_setup import logger, log_error_details
-        
         logger.info(f"Iniciando conversión de PDF a Markdown: {pdf_path}")
         
         try:
@@ -62,6 +85,14 @@ class PDFToMarkdownUseCase:
             file_size_mb = pdf_path.stat().st_size / (1024 * 1024)
             logger.info(f"Archivo PDF: {pdf_path.name}, Tamaño: {file_size_mb:.2f} MB")
             
+            cache_key = None
+            if self.markdown_cache is not None:
+                cache_key = self.markdown_cache.get_key(pdf_path, self._cache_variant())
+                cached = self.markdown_cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"Resultado en caché para {pdf_path.name}, omitiendo extracción")
+                    return self.storage_port.save_markdown(pdf_path.stem, cached)
+
             # Extraer contenido del PDF
             logger.info("Extrayendo contenido del PDF")
             try:
@@ -73,6 +104,7 @@ class PDFToMarkdownUseCase:
                 raise
             
             # Refinar el contenido con LLM solo si está disponible
+            refined = True
             if self.llm_port is not None:
                 try:
                     logger.info("Iniciando refinamiento con LLM")
@@ -81,7 +113,13 @@ class PDFToMarkdownUseCase:
                 except Exception as llm_error:
                     logger.warning(f"LLM refinement failed, using raw text: {llm_error}")
                     log_error_details(llm_error, "Refinamiento LLM")
+                    refined = False
             
+            # El texto sin refinar no se cachea con la clave de la variante LLM,
+            # para que el refinamiento se reintente en la próxima conversión
+            if cache_key is not None and refined:
+                self.markdown_cache.set(cache_key, markdown_content)
+
             # Guardar el resultado
             try:
                 logger.info(f"Guardando resultado para {pdf_path.stem}")
@@ -3,6 +3,7 @@ API Configuration and Credentials.
 Robust environment variable loading using python-dotenv.
 Supports multiple LLM providers with fallback options.
 """
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
@@ -28,23 +29,44 @@ DEFAULT_SETTINGS = {
     }
 }
 
+# .env in project root
+ENV_PATH = Path(__file__).parent.parent.parent / ".env"
+
 def load_api_settings() -> dict:
     """
     Load and validate API settings from environment variables.
     Looks for .env file in project root directory.
     
+    The result is cached and only rebuilt when the .env file changes
+    (or after ``invalidate_api_settings``).
+
     Returns:
         dict: Validated API configuration with available providers
     """
+    try:
+        env_mtime_ns = ENV_PATH.stat().st_mtime_ns
+    except OSError:
+        env_mtime_ns = None
+
+    # Copy so callers cannot alter the cached settings
+    return {provider: dict(cfg) for provider, cfg in _load_api_settings(env_mtime_ns).items()}
+
+
+def invalidate_api_settings() -> None:
+    """Discard the cached API settings; the next load re-reads the environment."""
+    _load_api_settings.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _load_api_settings(env_mtime_ns: Optional[int]) -> dict:
+    """Build the API settings; memoized by the .env modification time."""
     from infrastructure.logging_setup import logger
     
-    # Look for .env in project root and load it
-    project_root = Path(__file__).parent.parent.parent
-    env_path = project_root / ".env"
+    env_path = ENV_PATH
     
     # Cargar .env si existe
-    if env_path.exists():
-        logger.debug(f"Loading environment from {env_path}")
+    if env_mtime_ns is not None:
+        logger.debug("Loading environment from %s", env_path)
         load_dotenv(str(env_path), override=True)  # Asegurar que se sobreescriban las variables existentes
         logger.debug("Environment variables loaded successfully")
     else:
@@ -59,7 +81,7 @@ def load_api_settings() -> dict:
         "DEEPSEEK_API_KEY": bool(os.getenv("DEEPSEEK_API_KEY")),
         "DEEPSEEK_MODEL_ID": os.getenv("DEEPSEEK_MODEL_ID")
     }
-    logger.debug(f"Loaded environment variables: {env_vars}")
+    logger.debug("Loaded environment variables: %s", env_vars)
     
     config = {}
     
@@ -92,9 +114,9 @@ def load_api_settings() -> dict:
             "max_retries": int(os.getenv("DEEPSEEK_MAX_RETRIES", "5"))
         }
     
-    logger.debug(f"Loaded API configurations: {list(config.keys())}")
+    logger.debug("Loaded API configurations: %s", list(config))
     for provider, cfg in config.items():
         masked_key = cfg.get("api_key", "")[:10] + "..." if cfg.get("api_key") else "None"
-        logger.debug(f"{provider} config: api_key={masked_key}, model={cfg.get('model_id')}")
+        logger.debug("%s config: api_key=%s, model=%s", provider, masked_key, cfg.get('model_id'))
     
     return config
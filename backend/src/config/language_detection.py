@@ -7,18 +7,49 @@ from loguru import logger
 import fasttext
 import langdetect
 
-class LanguageDetector:
-    def __init__(self):
-        self.fasttext_model = None
-        self.model_path = Path("/app/data/models/fasttext/lid.176.ftz")
+MODEL_PATH = Path("/app/data/models/fasttext/lid.176.ftz")
+
+# Modelo compartido; se carga en la primera detección, no al importar el módulo
+_MODEL = None
+_MODEL_LOADED = False
+
+
+def _get_model():
+    """
+    Devuelve el modelo FastText, cargándolo una sola vez por proceso.
+
+    Returns:
+        Modelo FastText o None si no existe o no se pudo cargar
+    """
+    global _MODEL, _MODEL_LOADED
+    if not _MODEL_LOADED:
+        _MODEL_LOADED = True
         try:
             # Solo intentar cargar el modelo si existe
-            if self.model_path.exists():
-                self.fasttext_model = fasttext.load_model(str(self.model_path))
+            if MODEL_PATH.exists():
+                _MODEL = fasttext.load_model(str(MODEL_PATH))
             else:
                 logger.warning("Modelo FastText no encontrado, usando langdetect como respaldo")
         except Exception as e:
             logger.warning(f"No se pudo cargar FastText, usando langdetect como respaldo: {e}")
+    return _MODEL
+
+
+def _to_iso(label: str) -> str:
+    """Convierte una etiqueta de FastText en código de idioma (spa -> es)."""
+    lang_code = label.replace("__label__", "")
+    # Convertir códigos de 3 letras a 2 letras si es necesario
+    if lang_code == "spa":
+        return "es"
+    return lang_code
+
+class LanguageDetector:
+    model_path = MODEL_PATH
+
+    @property
+    def fasttext_model(self):
+        """Modelo FastText compartido (None si no está disponible)."""
+        return _get_model()
     
     def detect(self, text: str) -> str:
         """
@@ -36,12 +67,9 @@ class LanguageDetector:
         try:
             # Intentar primero con FastText si está disponible
             if self.fasttext_model:
-                predictions = self.fasttext_model.predict(text, k=1)
-                lang_code = predictions[0][0].replace("__label__", "")
-                # Convertir códigos de 3 letras a 2 letras si es necesario
-                if lang_code == "spa":
-                    return "es"
-                return lang_code
+                # FastText procesa una sola línea: no admite '\n'
+                predictions = self.fasttext_model.predict(text.replace("\n", " "), k=1)
+                return _to_iso(predictions[0][0])
                 
             # Fallback a langdetect
             return langdetect.detect(text)
@@ -1,5 +1,6 @@
 """LLM configuration state management."""
 from typing import Optional, Dict, Any
+import copy
 import json
 from pathlib import Path
 from infrastructure.logging_setup import logger
@@ -20,6 +21,11 @@ class LLMConfig:
         }
     }
     
+    # In-memory copy of the configuration; disk is only read the first time
+    _config: Optional[Dict[str, Any]] = None
+    # Last provider reported in the log
+    _logged_provider: Any = object()
+
     @classmethod
     def save_config(cls, config: Dict[str, Any]) -> None:
         """Save LLM configuration to file.
@@ -33,21 +39,31 @@ class LLMConfig:
                 json.dump(config, f, indent=2)
         except Exception as e:
             logger.error(f"Error saving LLM config: {e}")
+        cls._config = copy.deepcopy(config)
 
     @classmethod
     def load_config(cls) -> Dict[str, Any]:
         """Load LLM configuration from file.
         
         Returns:
-            Dictionary with current LLM configuration
+            Dictionary with current LLM configuration (a copy; use
+            ``save_config`` to persist changes)
         """
-        try:
-            if CONFIG_FILE.exists():
-                with open(CONFIG_FILE) as f:
-                    return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading LLM config: {e}")
-        return cls.DEFAULT_CONFIG.copy()
+        return copy.deepcopy(cls._current_config())
+
+    @classmethod
+    def _current_config(cls) -> Dict[str, Any]:
+        """Return the in-memory configuration, reading the file on first use."""
+        if cls._config is None:
+            config = None
+            try:
+                if CONFIG_FILE.exists():
+                    with open(CONFIG_FILE) as f:
+                        config = json.load(f)
+            except Exception as e:
+                logger.error(f"Error loading LLM config: {e}")
+            cls._config = config if config is not None else copy.deepcopy(cls.DEFAULT_CONFIG)
+        return cls._config
     
     @classmethod
     def get_current_provider(cls) -> Optional[str]:
@@ -56,14 +72,15 @@ class LLMConfig:
         Returns:
             Provider name or None if LLM processing is disabled
         """
-        config = cls.load_config()
-        provider = config.get("provider")
+        provider = cls._current_config().get("provider")
         
         # Log provider state change
-        if provider:
-            logger.info(f"Using LLM provider: {provider}")
-        else:
-            logger.info("LLM processing is disabled")
+        if provider != cls._logged_provider:
+            cls._logged_provider = provider
+            if provider:
+                logger.info(f"Using LLM provider: {provider}")
+            else:
+                logger.info("LLM processing is disabled")
             
         return provider
     
@@ -14,6 +14,22 @@ logger = logging.getLogger(__name__)
 REQUIRED_LLM_KEYS = ["OPENAI_API_KEY"]
 OPTIONAL_LLM_KEYS = ["GEMINI_API_KEY", "DEEPSEEK_API_KEY", "ANTHROPIC_API_KEY"]
 
+
+def _configured_keys() -> frozenset:
+    """
+    Toma una instantánea de las claves LLM definidas (y no vacías) en el entorno.
+
+    Returns:
+        frozenset: Nombres de las variables de entorno con valor
+    """
+    env = os.environ
+    return frozenset(k for k in REQUIRED_LLM_KEYS + OPTIONAL_LLM_KEYS if env.get(k))
+
+
+def _provider_name(provider_key: str) -> str:
+    """Extrae el nombre del proveedor (ej: OPENAI_API_KEY -> openai)."""
+    return provider_key.split('_', 1)[0].lower()
+
 def check_llm_keys(strict: bool = False) -> dict:
     """
     Verifica la presencia de claves de API para proveedores LLM.
@@ -25,16 +41,18 @@ def check_llm_keys(strict: bool = False) -> dict:
     Returns:
         dict: Un diccionario con el estado de las claves (True/False)
     """
+    configured = _configured_keys()
+
     # Verificar claves requeridas
-    missing_required = [k for k in REQUIRED_LLM_KEYS if not os.getenv(k)]
+    missing_required = [k for k in REQUIRED_LLM_KEYS if k not in configured]
     
     # Verificar claves opcionales
-    available_optional = {k: bool(os.getenv(k)) for k in OPTIONAL_LLM_KEYS}
+    available_optional = {k: k in configured for k in OPTIONAL_LLM_KEYS}
     
     # Crear resumen de estado
     status = {
         "required_complete": len(missing_required) == 0,
-        "available_providers": {k: bool(os.getenv(k)) for k in REQUIRED_LLM_KEYS + OPTIONAL_LLM_KEYS if os.getenv(k)},
+        "available_providers": {k: True for k in REQUIRED_LLM_KEYS + OPTIONAL_LLM_KEYS if k in configured},
         "missing_required": missing_required,
         "available_optional": available_optional
     }
@@ -63,17 +81,8 @@ def get_available_llm_provider():
     Returns:
         str or None: Nombre del proveedor LLM disponible, o None si no hay ninguno.
     """
-    # Orden de prioridad para proveedores
-    priority_order = REQUIRED_LLM_KEYS + OPTIONAL_LLM_KEYS
-    
-    # Verificar cada proveedor en orden
-    for provider_key in priority_order:
-        if os.getenv(provider_key):
-            # Extraer nombre del proveedor (ej: OPENAI_API_KEY -> openai)
-            provider_name = provider_key.split('_')[0].lower()
-            return provider_name
-    
-    return None
+    providers = get_available_llm_providers()
+    return providers[0] if providers else None
 
 def get_available_llm_providers():
     """
@@ -82,13 +91,10 @@ def get_available_llm_providers():
     Returns:
         list: Lista de nombres de proveedores LLM disponibles.
     """
-    available_providers = []
-    all_provider_keys = REQUIRED_LLM_KEYS + OPTIONAL_LLM_KEYS
-    
-    for provider_key in all_provider_keys:
-        if os.getenv(provider_key):
-            # Extraer nombre del proveedor (ej: OPENAI_API_KEY -> openai)
-            provider_name = provider_key.split('_')[0].lower()
-            available_providers.append(provider_name)
-    
-    return available_providers
+    # Orden de prioridad: requeridas primero, luego opcionales
+    configured = _configured_keys()
+    return [
+        _provider_name(provider_key)
+        for provider_key in REQUIRED_LLM_KEYS + OPTIONAL_LLM_KEYS
+        if provider_key in configured
+    ]
@@ -17,6 +17,12 @@ class OCRSettings:
     # Configuración básica
     DPI = int(os.getenv('OCR_DPI', 300))
     OCR_LANG = os.getenv('OCR_LANG', 'spa')
+    # Motor OCR para páginas escaneadas: "tesseract" o "easyocr" (GPU)
+    OCR_ENGINE = os.getenv('OCR_ENGINE', 'tesseract').lower()
+    # Caché de OCR por franjas (cabecera/cuerpo/pie) para páginas escaneadas
+    OCR_SEGMENT_CACHE = os.getenv('OCR_SEGMENT_CACHE', 'false').lower() == 'true'
+    # Caché persistente del texto OCR de páginas completas, por contenido de la página
+    OCR_PAGE_CACHE = os.getenv('OCR_PAGE_CACHE', 'true').lower() == 'true'
     
     # Rutas
     CORRECTIONS_PATH = Path("tools/data/corrections/corrections.csv")
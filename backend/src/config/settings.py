@@ -37,5 +37,16 @@ class Settings(BaseSettings):
         env_file = ".env"
         env_file_encoding = "utf-8"
 
-# Instancia global de configuración
-settings = Settings()
+
+# Instancia global de configuración (se crea en el primer acceso)
+_settings: Optional[Settings] = None
+
+
+def __getattr__(name: str):
+    """Crea la instancia ``settings`` de forma perezosa (PEP 562)."""
+    global _settings
+    if name == "settings":
+        if _settings is None:
+            _settings = Settings()
+        return _settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
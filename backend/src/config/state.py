@@ -1,17 +1,29 @@
 # src/config/state.py
 import os
+from enum import IntEnum
 from dotenv import load_dotenv
 from infrastructure.logging_setup import logger
 
 """
 Estado global compartido para el modo LLM.
 
-Valores posibles:
-    • "off"    → desactiva LLM
-    • "prompt" → usa prompt directo
+Valores posibles (``LLMMode``):
+    • OFF    → desactiva LLM
+    • FT     → usa modelo fine-tuned
+    • PROMPT → usa prompt directo
+    • AUTO   → elige según el contenido
 """
 
-def load_configuration():
+
+class LLMMode(IntEnum):
+    """Modo LLM; se compara por identidad (``is``) en lugar de por cadena."""
+    OFF = 0
+    FT = 1
+    PROMPT = 2
+    AUTO = 3
+
+
+def load_configuration() -> LLMMode:
     """Carga la configuración desde variables de entorno."""
     # Cargar variables de entorno desde .env
     load_dotenv()
@@ -19,9 +31,9 @@ def load_configuration():
     # Verificar configuración LLM
     if not os.getenv("OPENAI_API_KEY") and not os.getenv("GEMINI_API_KEY"):
         logger.warning("No se encontraron claves de API para los proveedores LLM")
-        return "off"
+        return LLMMode.OFF
     
-    return "prompt"
+    return LLMMode.PROMPT
 
 # Se ejecuta una sola vez al importar `config.state`
 LLM_MODE = load_configuration()
\ No newline at end of file
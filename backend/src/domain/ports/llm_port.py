@@ -44,5 +44,9 @@ class LLMPort(ABC):
             
         Returns:
             str: Texto formateado en Markdown
+            
+        Raises:
+            LLMProviderError: Si no se pudo refinar el texto (el llamador
+                decide si usar el texto original)
         """
         pass
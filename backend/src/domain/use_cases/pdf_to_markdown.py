@@ -4,6 +4,7 @@ from domain.ports.document_port import DocumentPort
 from domain.ports.storage_port import StoragePort
 from domain.ports.llm_port import LLMPort
 from domain.dtos.document_dtos import DocumentInputDTO, DocumentOutputDTO
+from infrastructure.logging_setup import logger, log_error_details
 
 class PDFToMarkdownUseCase:
     """Caso de uso para la conversión de PDF a Markdown."""
@@ -42,8 +43,6 @@ class PDFToMarkdownUseCase:
             StorageError: Si hay problemas al guardar el resultado
             LLMError: Si hay problemas con el refinamiento del texto
         """
-        from infrastructure.logging_setup import logger, log_error_details
-        
         logger.info(f"Iniciando conversión de PDF a Markdown: {input_dto.file_path}")
         pdf_path = Path(input_dto.file_path)
         
@@ -114,7 +113,7 @@ class PDFToMarkdownUseCase:
                 
             # Crear y retornar DTO de salida
             output_dto = DocumentOutputDTO(
-                id=input_dto.file_path.split('/')[-1].split('_')[0],  # Extraer ID del nombre del archivo
+                id=pdf_path.stem.split('_', 1)[0],  # Extraer ID del nombre del archivo
                 file_path=str(pdf_path),
                 total_pages=metadata.page_count if metadata else 1,
                 processed_successfully=True,
@@ -3,7 +3,8 @@ from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class DocumentMetadata:
     """Value object that represents metadata of a document."""
     
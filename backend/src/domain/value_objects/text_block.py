@@ -3,7 +3,8 @@ from dataclasses import dataclass
 from typing import Optional
 from .text_coordinates import TextCoordinates
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TextBlock:
     """Value object that represents a block of text with its position and content."""
     
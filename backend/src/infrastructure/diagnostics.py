@@ -5,16 +5,61 @@ Este módulo proporciona funciones para diagnosticar problemas con el
 procesamiento de documentos PDF, incluyendo verificación de permisos,
 validación de formato, y diagnóstico de OCR.
 """
+import atexit
 import os
 import sys
-import tempfile
 import subprocess
+import threading
+from functools import lru_cache
 from pathlib import Path
-import fitz  # PyMuPDF
-from PIL import Image
-import pytesseract
 from loguru import logger
 
+# PyMuPDF, Pillow y Tesseract se importan dentro de cada función: cargan
+# bibliotecas nativas pesadas que solo hacen falta al ejecutar un diagnóstico.
+
+# Páginas iniciales en las que se busca texto embebido; basta con encontrarlo en una
+_TEXT_SCAN_PAGES = 5
+
+# Alto (px) al que se reescala la imagen de prueba antes del OCR
+_OCR_SAMPLE_HEIGHT = 130
+
+# Instancia persistente de Tesseract; PyTessBaseAPI no es segura entre hilos.
+# None: aún no creada; False: tesserocr no está instalado.
+_TESS_API = None
+_TESS_LOCK = threading.Lock()
+
+
+def _tesseract_api():
+    """
+    Devuelve la instancia compartida de tesserocr, creándola en el primer uso.
+
+    Debe llamarse con ``_TESS_LOCK`` adquirido.
+
+    Returns:
+        PyTessBaseAPI o None si tesserocr no está instalado
+    """
+    global _TESS_API
+    if _TESS_API is None:
+        try:
+            from tesserocr import PSM, PyTessBaseAPI
+        except ImportError:
+            _TESS_API = False
+        else:
+            _TESS_API = PyTessBaseAPI(lang='spa', psm=PSM.SINGLE_BLOCK)
+            atexit.register(_TESS_API.End)
+    return _TESS_API or None
+
+
+@lru_cache(maxsize=4)
+def _get_font(name: str = "Arial", size: int = 20):
+    """Carga una fuente TrueType una sola vez; si no existe, usa la fuente por defecto."""
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype(name, size)
+    except OSError:
+        return ImageFont.load_default()
+
 def check_file_permissions(file_path: Path) -> dict:
     """
     Verifica los permisos del archivo.
@@ -25,15 +70,30 @@ def check_file_permissions(file_path: Path) -> dict:
     Returns:
         dict: Información sobre los permisos del archivo
     """
+    # Una sola llamada a stat(); si falla, el archivo no existe
+    try:
+        st = file_path.stat()
+    except OSError:
+        return {
+            "exists": False,
+            "readable": False,
+            "writable": False,
+            "executable": False,
+            "size_bytes": 0,
+            "size_mb": 0,
+            "owner": "N/A",
+            "permissions": "N/A"
+        }
+
     result = {
-        "exists": file_path.exists(),
+        "exists": True,
         "readable": os.access(file_path, os.R_OK),
         "writable": os.access(file_path, os.W_OK),
         "executable": os.access(file_path, os.X_OK),
-        "size_bytes": file_path.stat().st_size if file_path.exists() else 0,
-        "size_mb": file_path.stat().st_size / (1024 * 1024) if file_path.exists() else 0,
-        "owner": get_file_owner(file_path) if file_path.exists() else "N/A",
-        "permissions": oct(file_path.stat().st_mode)[-3:] if file_path.exists() else "N/A"
+        "size_bytes": st.st_size,
+        "size_mb": st.st_size / (1024 * 1024),
+        "owner": _owner_name(st.st_uid),
+        "permissions": oct(st.st_mode)[-3:]
     }
     
     return result
@@ -49,29 +109,65 @@ def get_file_owner(file_path: Path) -> str:
         str: Nombre del propietario
     """
     try:
-        if sys.platform == "win32":
-            # En Windows, es más complejo obtener el propietario
-            return "Desconocido (Windows)"
-        else:
-            # En sistemas Unix, podemos usar stat o subprocess
-            import pwd
-            stat_info = os.stat(file_path)
-            uid = stat_info.st_uid
-            user = pwd.getpwuid(uid).pw_name
-            return user
+        return _owner_name(os.stat(file_path).st_uid)
+    except Exception as e:
+        return f"Error al obtener propietario: {e}"
+
+
+def _owner_name(uid: int) -> str:
+    """Resuelve el nombre de usuario para un uid ya obtenido con stat()."""
+    if sys.platform == "win32":
+        # En Windows, es más complejo obtener el propietario
+        return "Desconocido (Windows)"
+    try:
+        import pwd
+        return pwd.getpwuid(uid).pw_name
     except Exception as e:
         return f"Error al obtener propietario: {e}"
 
-def check_pdf_validity(file_path: Path) -> dict:
+
+def check_pdf_validity(file_path: Path, max_text_pages: int = _TEXT_SCAN_PAGES) -> dict:
     """
     Verifica si el archivo es un PDF válido.
     
+    El resultado se memoiza por (ruta, mtime, tamaño): un PDF sin cambios no
+    se vuelve a abrir con MuPDF en diagnósticos posteriores.
+
     Args:
         file_path: Ruta al archivo
+        max_text_pages: Número de páginas iniciales en las que buscar texto
         
     Returns:
         dict: Información sobre la validez del PDF
     """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return _check_pdf_validity(file_path, max_text_pages)
+
+    result = _check_pdf_validity_cached(
+        os.path.abspath(file_path), st.st_mtime_ns, st.st_size, max_text_pages
+    )
+    # Copia para que el llamador no altere la entrada cacheada
+    metadata = result["metadata"]
+    return {**result, "metadata": dict(metadata) if metadata is not None else None}
+
+
+@lru_cache(maxsize=1024)
+def _check_pdf_validity_cached(path: str, mtime_ns: int, size: int, max_text_pages: int) -> dict:
+    """Versión memoizada de ``_check_pdf_validity``; mtime y tamaño invalidan la entrada."""
+    return _check_pdf_validity(Path(path), max_text_pages)
+
+
+def clear_pdf_cache() -> None:
+    """Vacía la caché de resultados de ``check_pdf_validity``."""
+    _check_pdf_validity_cached.cache_clear()
+
+
+def _check_pdf_validity(file_path: Path, max_text_pages: int) -> dict:
+    """Abre el PDF con MuPDF y recopila la información de validez."""
+    import fitz  # PyMuPDF
+
     result = {
         "is_valid": False,
         "error": None,
@@ -90,10 +186,10 @@ def check_pdf_validity(file_path: Path) -> dict:
             result["version"] = doc.pdf_version
             result["is_encrypted"] = doc.is_encrypted
             
-            # Verificar si tiene texto
+            # Verificar si tiene texto (sin análisis de ligaduras ni espacios)
             has_text = False
-            for page in doc:
-                if page.get_text().strip():
+            for i in range(min(doc.page_count, max_text_pages)):
+                if doc.load_page(i).get_text("text", flags=fitz.TEXT_MEDIABOX_CLIP).strip():
                     has_text = True
                     break
             result["has_text"] = has_text
@@ -104,6 +200,9 @@ def check_pdf_validity(file_path: Path) -> dict:
     except Exception as e:
         result["is_valid"] = False
         result["error"] = str(e)
+    finally:
+        # Liberar la caché interna de MuPDF, que no tiene límite por defecto
+        fitz.TOOLS.store_shrink(100)
     
     return result
 
@@ -127,29 +226,35 @@ def test_ocr_capability(sample_text="Este es un texto de prueba para OCR") -> di
     }
     
     try:
-        # Verificar versión de Tesseract
-        result["tesseract_version"] = pytesseract.get_tesseract_version()
+        from PIL import Image, ImageDraw
+        import pytesseract
+        from adapters.out.ocr.ocr_adapter import preprocess_for_ocr
         
-        # Crear una imagen temporal con el texto
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            temp_img_path = tmp.name
+        # Verificar versión de Tesseract
+        with _TESS_LOCK:
+            api = _tesseract_api()
+        if api is not None:
+            from tesserocr import tesseract_version
+            result["tesseract_version"] = tesseract_version().splitlines()[0]
+        else:
+            result["tesseract_version"] = pytesseract.get_tesseract_version()
         
-        # Generar imagen con texto
+        # Generar imagen con texto (en memoria; el OCR no necesita archivo)
         img = Image.new('RGB', (600, 100), color=(255, 255, 255))
-        from PIL import ImageDraw, ImageFont
         draw = ImageDraw.Draw(img)
-        try:
-            # Intentar usar una fuente del sistema
-            font = ImageFont.truetype("Arial", 20)
-        except:
-            # Si no se encuentra, usar la fuente por defecto
-            font = ImageFont.load_default()
+        draw.text((10, 10), sample_text, font=_get_font(), fill=(0, 0, 0))
         
-        draw.text((10, 10), sample_text, font=font, fill=(0, 0, 0))
-        img.save(temp_img_path)
+        # Escala de grises + reescalado + binarización: menos datos y mejor precisión
+        img = preprocess_for_ocr(img, target_height=_OCR_SAMPLE_HEIGHT)
         
-        # Procesar la imagen con OCR
-        detected_text = pytesseract.image_to_string(img, lang='spa').strip()
+        # Procesar la imagen con OCR, reutilizando el motor ya cargado si existe
+        with _TESS_LOCK:
+            api = _tesseract_api()
+            if api is not None:
+                api.SetImage(img)
+                detected_text = api.GetUTF8Text().strip()
+        if api is None:
+            detected_text = pytesseract.image_to_string(img, lang='spa').strip()
         result["detected_text"] = detected_text
         
         # Calcular precisión simple
@@ -162,10 +267,6 @@ def test_ocr_capability(sample_text="Este es un texto de prueba para OCR") -> di
         
         result["ocr_available"] = True
         
-        # Limpiar
-        if os.path.exists(temp_img_path):
-            os.unlink(temp_img_path)
-        
     except Exception as e:
         result["error"] = str(e)
     
@@ -205,6 +306,10 @@ def diagnose_pdf_processing(file_path: Path) -> dict:
     logger.info(f"Capacidad de OCR: {result['ocr_capability']}")
     
     # Información sobre bibliotecas
+    import fitz  # PyMuPDF
+    from PIL import Image
+    import pytesseract
+
     result["libraries_info"] = {
         "pymupdf_version": fitz.version,
         "pillow_version": Image.__version__,
@@ -7,6 +7,7 @@ y mejorando el rendimiento general del sistema.
 import hashlib
 import json
 import os
+import shutil
 from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Any
@@ -44,6 +45,17 @@ class LLMCache:
         key_str = "|".join(key_parts)
         return hashlib.md5(key_str.encode('utf-8')).hexdigest()
 
+    def _path(self, key: str) -> Path:
+        """Ruta del archivo de una entrada, repartida en 256 subdirectorios.
+
+        Args:
+            key: Hash de la solicitud
+
+        Returns:
+            ``cache_dir/ab/abcdef….json`` según los dos primeros caracteres
+        """
+        return self.cache_dir / key[:2] / f"{key}.json"
+
     def get(self, text: str, model: str, temperature: float = 0.0) -> Optional[str]:
         """Obtiene un resultado cacheado para una solicitud LLM.
 
@@ -62,7 +74,7 @@ class LLMCache:
             return self.memory_cache[key]
 
         # Luego buscar en disco
-        cache_file = self.cache_dir / f"{key}.json"
+        cache_file = self._path(key)
         if cache_file.exists():
             try:
                 with open(cache_file, 'r', encoding='utf-8') as f:
@@ -89,7 +101,7 @@ class LLMCache:
         self.memory_cache[key] = result
 
         # Guardar en disco
-        cache_file = self.cache_dir / f"{key}.json"
+        cache_file = self._path(key)
         data = {
             'content': result,
             'params': {
@@ -101,6 +113,7 @@ class LLMCache:
         }
 
         try:
+            cache_file.parent.mkdir(exist_ok=True)
             with open(cache_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False)
         except IOError:
@@ -121,7 +134,7 @@ class LLMCache:
             del self.memory_cache[key]
 
         # Eliminar de disco
-        cache_file = self.cache_dir / f"{key}.json"
+        cache_file = self._path(key)
         if cache_file.exists():
             try:
                 cache_file.unlink()
@@ -133,9 +146,9 @@ class LLMCache:
         # Limpiar memoria
         self.memory_cache.clear()
 
-        # Limpiar disco
+        # Limpiar disco (subdirectorios incluidos)
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+            shutil.rmtree(self.cache_dir)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         except (IOError, OSError):
             pass  # Fallar silenciosamente
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""Sistema de caché para resultados de conversión PDF → Markdown.
+
+Guarda en disco el Markdown final de cada PDF indexado por el hash de su
+contenido, de modo que volver a procesar un archivo sin cambios no repite
+la extracción ni el refinamiento LLM.
+"""
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+
+@lru_cache(maxsize=128)
+def _content_hash(path: str, mtime_ns: int, size: int) -> str:
+    """Calcula el hash BLAKE2 del archivo; memoizado por (ruta, mtime, tamaño)."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class MarkdownCache:
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        """Inicializa el sistema de caché de Markdown.
+
+        Args:
+            cache_dir: Directorio para almacenar caché persistente.
+                      Si es None, usa 'data/cache/markdown'.
+        """
+        self.cache_dir = cache_dir or Path('data/cache/markdown')
+
+    def get_key(self, pdf_path: Path, variant: str = "raw") -> str:
+        """Genera la clave de caché para un PDF.
+
+        Args:
+            pdf_path: Ruta al archivo PDF
+            variant: Identifica el modo de procesamiento (p. ej. proveedor LLM)
+
+        Returns:
+            Clave única para este contenido y modo
+        """
+        stat = pdf_path.stat()
+        content_hash = _content_hash(str(pdf_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        return f"{content_hash}_{variant}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Obtiene el Markdown cacheado para una clave.
+
+        Args:
+            key: Clave generada por ``get_key``
+
+        Returns:
+            Contenido cacheado o None si no existe
+        """
+        try:
+            return (self.cache_dir / f"{key}.md").read_text(encoding='utf-8')
+        except (FileNotFoundError, IOError):
+            return None
+
+    def set(self, key: str, markdown: str) -> None:
+        """Almacena el Markdown de forma atómica.
+
+        Args:
+            key: Clave generada por ``get_key``
+            markdown: Contenido a almacenar
+        """
+        cache_file = self.cache_dir / f"{key}.md"
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(markdown, encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except (IOError, OSError):
+            pass  # Fallar silenciosamente si no se puede escribir
+
+    def clear(self) -> None:
+        """Limpia toda la caché en disco."""
+        _content_hash.cache_clear()
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md"):
+                        os.unlink(entry.path)
+        except (IOError, OSError):
+            pass  # Fallar silenciosamente
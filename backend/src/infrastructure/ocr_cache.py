@@ -5,14 +5,28 @@ Implementa un sistema de caché persistente y en memoria para
 resultados de OCR y refinamiento LLM, mejorando el rendimiento
 y reduciendo llamadas a APIs externas.
 """
+import atexit
 import hashlib
-import json
-import os
+import queue
+import sqlite3
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Callable, List, Optional, Tuple
 from PIL import Image
-import numpy as np
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Franjas horizontales de página para la caché por segmentos: cabecera (1/6),
+# cuerpo y pie (1/6), como fracciones de la altura
+_BAND_CUTS = (0, 1 / 6, 5 / 6, 1)
+
+# Entradas máximas en memoria; las menos usadas se descartan (siguen en disco)
+MAX_MEM_ENTRIES = 512
 
 
 class OCRCache:
@@ -25,18 +39,108 @@ class OCRCache:
                       Si es None, usa 'data/cache/ocr'.
         """
         self.cache_dir = cache_dir or Path('data/cache/ocr')
-        self.memory_cache: Dict[str, str] = {}
+        self.memory_cache: "OrderedDict[str, str]" = OrderedDict()
+        # Almacén persistente: una sola base SQLite en lugar de un JSON por entrada
+        self.db_path = self.cache_dir / 'ocr.db'
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        # Escritura diferida: set() encola y un hilo en segundo plano escribe en disco
+        self._write_q: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+        threading.Thread(target=self._writer_loop, name="ocr-cache-writer", daemon=True).start()
+        atexit.register(self.flush)
 
     def _ensure_cache_dir(self) -> None:
         """Asegura que el directorio de caché existe."""
-        if not self.cache_dir.exists():
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _connection(self, create: bool = True) -> sqlite3.Connection:
+        """
+        Abre la base SQLite de la caché la primera vez que se necesita.
+
+        Debe llamarse con ``_db_lock`` adquirido.
+
+        Args:
+            create: Si es False y la base no existe, lanza sqlite3.OperationalError
+                    en lugar de crearla (evita un exists() previo en las lecturas)
+        """
+        if self._db is None:
+            if create:
+                self._ensure_cache_dir()
+                db = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            else:
+                db = sqlite3.connect(
+                    f"{self.db_path.resolve().as_uri()}?mode=rw",
+                    uri=True, isolation_level=None, check_same_thread=False
+                )
+            # Páginas de 4 KiB (solo surte efecto al crear la base)
+            db.execute('PRAGMA page_size=4096')
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            db.execute('CREATE TABLE IF NOT EXISTS ocr_text (key TEXT PRIMARY KEY, content TEXT NOT NULL)')
+            self._db = db
+        return self._db
 
-    @lru_cache(maxsize=100)
     def get_image_hash(self, image: Image.Image) -> str:
-        """Genera un hash único para una imagen."""
-        img_array = np.array(image)
-        return hashlib.md5(img_array.tobytes()).hexdigest()
+        """
+        Genera un hash para una imagen a partir de todos sus píxeles.
+
+        La clave es exacta: páginas casi idénticas (p. ej. formularios que solo
+        difieren en unos dígitos) no comparten entrada.
+
+        Args:
+            image: Imagen a identificar
+
+        Returns:
+            Hash hexadecimal de la imagen
+        """
+        digest = hashlib.blake2b(f"{image.mode}-{image.size}".encode(), digest_size=16)
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    def ocr_by_bands(
+        self,
+        image: Image.Image,
+        ocr_fn: Callable[[Image.Image], str],
+        should_cache: Callable[[str], bool] = bool,
+    ) -> str:
+        """
+        Aplica OCR a una página por franjas, cacheando el texto de cada una.
+
+        Cabeceras y pies que se repiten en todas las páginas se reconocen una
+        sola vez por documento. Las franjas se identifican por sus píxeles
+        exactos (no por miniatura), de modo que un pie que solo cambia en el
+        número de página no reutiliza el texto de otra página.
+
+        Args:
+            image: Imagen de la página
+            ocr_fn: Función que aplica OCR a una franja
+            should_cache: Indica si un resultado puede guardarse (p. ej. no
+                          guardar marcadores de error)
+
+        Returns:
+            Texto de las franjas no vacías, unidas por saltos de línea
+        """
+        width, height = image.size
+        cuts = [round(height * f) for f in _BAND_CUTS]
+        texts = []
+        for top, bottom in zip(cuts, cuts[1:]):
+            if bottom <= top:
+                continue
+            band = image.crop((0, top, width, bottom))
+            data = band.tobytes()
+            digest = (
+                xxhash.xxh3_128(data).hexdigest() if xxhash is not None
+                else hashlib.blake2b(data, digest_size=16).hexdigest()
+            )
+            key = f"band-{band.mode}-{width}x{bottom - top}-{digest}"
+            text = self.get(key)
+            if text is None:
+                text = ocr_fn(band)
+                if should_cache(text):
+                    self.set(key, text)
+            if text:
+                texts.append(text)
+        return "\n".join(texts)
 
     def get(self, key: str) -> Optional[str]:
         """
@@ -49,22 +153,28 @@ class OCRCache:
             Contenido cacheado o None si no existe
         """
         # Primero buscar en memoria
-        if key in self.memory_cache:
-            return self.memory_cache[key]
+        content = self.memory_cache.get(key)
+        if content is not None:
+            try:
+                self.memory_cache.move_to_end(key)
+            except KeyError:
+                pass  # Descartada entre tanto por otro hilo
+            return content
             
-        # Luego buscar en disco si el directorio existe
-        if self.cache_dir.exists():
-            cache_file = self.cache_dir / f"{key}.json"
-            if cache_file.exists():
-                try:
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        self.memory_cache[key] = data['content']  # Actualizar caché en memoria
-                        return data['content']
-                except (json.JSONDecodeError, KeyError, IOError):
-                    return None
-                
-        return None
+        # Luego buscar en disco; si la base aún no existe, no hay entrada
+        try:
+            with self._db_lock:
+                row = self._connection(create=False).execute(
+                    'SELECT content FROM ocr_text WHERE key = ?', (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+
+        content = row[0]
+        self._remember(key, content)  # Actualizar caché en memoria
+        return content
 
     def set(self, key: str, value: str) -> None:
         """
@@ -74,23 +184,49 @@ class OCRCache:
             key: Clave única (normalmente hash de imagen)
             value: Contenido a almacenar
         """
-        # Guardar en memoria
+        # Guardar en memoria; el hilo escritor lo persiste sin bloquear al llamador
+        self._remember(key, value)
+        self._write_q.put((key, value))
+
+    def _remember(self, key: str, value: str) -> None:
+        """Guarda en la caché en memoria, descartando las entradas menos usadas."""
         self.memory_cache[key] = value
-        
-        # Asegurar que existe el directorio antes de guardar en disco
-        self._ensure_cache_dir()
-        
-        # Guardar en disco
-        cache_file = self.cache_dir / f"{key}.json"
-        data = {
-            'content': value,
-            'timestamp': os.path.getmtime(cache_file) if cache_file.exists() else None
-        }
-        
+        self.memory_cache.move_to_end(key)
+        while len(self.memory_cache) > MAX_MEM_ENTRIES:
+            self.memory_cache.popitem(last=False)
+
+    def flush(self) -> None:
+        """Espera a que el hilo escritor haya persistido todas las entradas encoladas."""
+        self._write_q.join()
+
+    def _writer_loop(self) -> None:
+        """Hilo escritor: agrupa en un lote todo lo encolado y lo escribe en disco."""
+        while True:
+            rows = [self._write_q.get()]
+            while True:
+                try:
+                    rows.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_rows(rows)
+            finally:
+                for _ in rows:
+                    self._write_q.task_done()
+
+    def _write_rows(self, rows: List[Tuple[str, str]]) -> None:
+        """Escribe un lote de entradas (texto tal cual) en una única transacción."""
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False)
-        except IOError:
+            with self._db_lock:
+                db = self._connection()
+                db.execute('BEGIN')
+                try:
+                    db.executemany('INSERT OR REPLACE INTO ocr_text (key, content) VALUES (?, ?)', rows)
+                    db.execute('COMMIT')
+                except sqlite3.Error:
+                    db.execute('ROLLBACK')
+                    raise
+        except (sqlite3.Error, OSError):
             pass  # Fallar silenciosamente si no se puede escribir
     
     def invalidate(self, key: str) -> None:
@@ -103,24 +239,36 @@ class OCRCache:
         # Eliminar de memoria
         if key in self.memory_cache:
             del self.memory_cache[key]
-            
-        # Eliminar de disco
-        cache_file = self.cache_dir / f"{key}.json"
-        if cache_file.exists():
-            try:
-                cache_file.unlink()
-            except IOError:
-                pass  # Fallar silenciosamente
+
+        # Eliminar de disco, tras las escrituras pendientes de esa misma clave
+        self.flush()
+        try:
+            with self._db_lock:
+                self._connection(create=False).execute('DELETE FROM ocr_text WHERE key = ?', (key,))
+        except sqlite3.Error:
+            pass  # Fallar silenciosamente
     
     def clear(self) -> None:
         """Limpia toda la caché (memoria y disco)."""
         # Limpiar memoria
         self.memory_cache.clear()
-        self.get_image_hash.cache_clear()
         
-        # Limpiar disco
+        # Limpiar disco, tras las escrituras pendientes
+        self.flush()
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
-        except (IOError, OSError):
-            pass  # Fallar silenciosamente
\ No newline at end of file
+            with self._db_lock:
+                self._connection(create=False).execute('DELETE FROM ocr_text')
+        except sqlite3.Error:
+            pass  # Fallar silenciosamente
+
+
+@lru_cache(maxsize=1)
+def shared_ocr_cache() -> OCRCache:
+    """
+    Devuelve la caché OCR compartida por todo el proceso.
+
+    Cada ``OCRCache`` arranca un hilo escritor, abre su propia conexión SQLite
+    y se registra en ``atexit``; los adaptadores que se crean por petición
+    deben usar esta instancia en lugar de construir una nueva.
+    """
+    return OCRCache()
@@ -1,9 +1,11 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import argparse
 import sys
 import os
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Configurar filtros de advertencias temprano
@@ -20,6 +22,9 @@ from loguru import logger
 logs_dir = Path("logs")
 logs_dir.mkdir(exist_ok=True)
 
+# Los handlers de loguru se añaden una sola vez por proceso
+_LOGGING_CONFIGURED = False
+
 # Importar el menú CLI
 def importar_menu():
     try:
@@ -30,14 +35,34 @@ def importar_menu():
         print(f"[ERROR] No se pudo cargar el menú CLI: {e}")
         sys.exit(1)
 
-def configurar_logging():
-    """Configuración del sistema de logging"""
+
+def parsear_argumentos(argv=None):
+    """Analiza la línea de comandos una sola vez.
+
+    Args:
+        argv: Argumentos a analizar (por defecto, sys.argv[1:])
+
+    Returns:
+        argparse.Namespace con ``log_level`` y la lista ``pdfs``
+    """
+    parser = argparse.ArgumentParser(description="Conversión de PDF a Markdown con OCR-PYMUPDF")
+    parser.add_argument("--log-level", default="INFO",
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="Nivel de log de consola y archivos")
+    parser.add_argument("pdfs", nargs="*",
+                        help="PDFs a convertir sin menú interactivo")
+    return parser.parse_args(argv)
+
+
+def configurar_logging(log_level="INFO"):
+    """Configuración del sistema de logging (idempotente)"""
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+
     # Eliminar handlers por defecto
     logger.remove()
     
-    # Procesar argumentos para nivel de log
-    log_level = "DEBUG" if "--log-level=DEBUG" in sys.argv else "INFO"
-    
     # Añadir handler para consola
     logger.add(
         sys.stderr,
@@ -71,18 +96,19 @@ def configurar_logging():
         level=log_level
     )
     
-    logger.debug(f"Log level set to: {log_level}")
+    _LOGGING_CONFIGURED = True
+    logger.debug("Log level set to: {}", log_level)
     logger.info(f"Sistema de logs inicializado en directorio: {logs_dir.absolute()}")
 
 def procesar_pdf_no_interactivo(pdf_arg):
-    """Procesa un PDF en modo no interactivo"""
-    from pathlib import Path
-    from application.use_cases.pdf_to_markdown import PDFToMarkdownUseCase
+    """Procesa un PDF en modo no interactivo.
     
+    Returns:
+        Ruta del Markdown generado, o None si la conversión falló
+    """
     # Importar adaptadores solo cuando se necesitan
     try:
-        from adapters.out.ocr.pymupdf_adapter import PyMuPDFAdapter
-        from adapters.out.storage.file_storage import FileStorage
+        from adapters.inbound.cli.cli_menu import build_markdown_use_case
     except ImportError as e:
         logger.error(f"Error al importar adaptadores: {e}")
         print(f"[ERROR] No se pudieron cargar los adaptadores necesarios: {e}")
@@ -103,21 +129,14 @@ def procesar_pdf_no_interactivo(pdf_arg):
         # Verificar permisos
         logger.info(f"Permisos de archivo: {oct(os.stat(pdf_path).st_mode)[-3:]}")
         
-        # Inicializar los puertos necesarios
-        document_port = PyMuPDFAdapter()
-        storage_port = FileStorage()
-        
-        # Crear y ejecutar el caso de uso
-        use_case = PDFToMarkdownUseCase(
-            document_port=document_port,
-            storage_port=storage_port,
-            llm_port=None  # Modo sin LLM para la linea de comandos
-        )
+        # Crear y ejecutar el caso de uso (sin LLM en la linea de comandos)
+        use_case = build_markdown_use_case(llm_port=None)
         
         logger.info("Iniciando conversión de PDF a Markdown")
         md_path = use_case.execute(pdf_path)
         logger.info(f"Conversión completada: {md_path}")
         print(f"[OK] Markdown generado: {md_path}")
+        return md_path
     except Exception as exc:
         logger.exception("Error durante la conversión")
         # Detallar el error
@@ -128,23 +147,47 @@ def procesar_pdf_no_interactivo(pdf_arg):
         
         print(f"[ERROR] Fallo la conversión a Markdown: {exc}")
         print(f"Consulte los logs en {logs_dir.absolute()} para más detalles")
+    finally:
+        # Los procesos del pool terminan con os._exit y no ejecutan atexit:
+        # se persisten aquí las páginas OCR pendientes de la caché compartida
+        from infrastructure.ocr_cache import shared_ocr_cache
+        if shared_ocr_cache.cache_info().currsize:
+            shared_ocr_cache().flush()
+
+
+def procesar_pdfs_no_interactivo(pdf_args):
+    """Procesa varios PDFs en paralelo, uno por proceso.
+
+    Cada proceso reutiliza sus adaptadores entre los PDFs que le toquen.
+    """
+    workers = min(len(pdf_args), os.cpu_count() or 1)
+    logger.info(f"Procesando {len(pdf_args)} archivos con {workers} procesos")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(procesar_pdf_no_interactivo, pdf_args))
+
+    ok = sum(1 for md_path in results if md_path is not None)
+    logger.info(f"Conversión por lotes terminada: {ok}/{len(pdf_args)} correctas")
+    print(f"[OK] {ok}/{len(pdf_args)} PDFs convertidos")
 
 def main() -> None:
     """Punto de entrada de la aplicacion OCR-PYMUPDF."""
+    args = parsear_argumentos()
+
     # Configurar sistema de logs
-    configurar_logging()
+    configurar_logging(args.log_level)
     
     logger.info("=== Iniciando aplicación OCR-PYMUPDF ===")
     logger.info(f"Python: {sys.version}")
     logger.info(f"Sistema operativo: {sys.platform}")
     
-    # Procesar argumentos de linea de comando
-    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
-    
     # Modo no interactivo
-    if args:
-        logger.info(f"Modo no interactivo con argumentos: {args}")
-        procesar_pdf_no_interactivo(args[0])
+    pdfs = args.pdfs
+    if pdfs:
+        logger.info(f"Modo no interactivo con argumentos: {pdfs}")
+        if len(pdfs) == 1:
+            procesar_pdf_no_interactivo(pdfs[0])
+        else:
+            procesar_pdfs_no_interactivo(pdfs)
         return  # Salir sin mostrar menu
         
     # Modo interactivo
@@ -11,6 +11,7 @@ root_path = Path(__file__).parents[2]
 sys.path.insert(0, str(root_path))
 
 import uvicorn
+from adapters.inbound.http.api.server_options import uvicorn_options
 
 if __name__ == "__main__":
     # Obtener host y puerto de las variables de entorno o usar valores por defecto
@@ -22,5 +23,5 @@ if __name__ == "__main__":
         "adapters.inbound.http.api.app:app",
         host=host,
         port=port,
-        reload=True
+        **uvicorn_options()
     )
\ No newline at end of file
@@ -11,7 +11,7 @@ import os
 import json
 import csv
 from pathlib import Path
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, FrozenSet, Iterable, Optional, Tuple
 import argparse
 import logging
 
@@ -19,6 +19,9 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Parsed word lists keyed by (path, mtime_ns, size); a modified file gets a new key
+_DICT_CACHE: Dict[Tuple[str, int, int], FrozenSet[str]] = {}
+
 
 class LegalDictionaryManager:
     """Manages legal terminology dictionaries and patterns."""
@@ -45,31 +48,39 @@ class LegalDictionaryManager:
         self.legal_patterns_file = self.dictionaries_dir / "legal_patterns.txt"
         self.corrections_file = self.corrections_dir / "corrections.csv"
         
-    def load_legal_words(self) -> Set[str]:
+    def load_legal_words(self) -> FrozenSet[str]:
         """
         Load legal words from the dictionary file.
         
+        The parsed set is cached until the file's modification time changes.
+        
         Returns:
-            Set of legal words in uppercase
+            Immutable set of legal words in uppercase
         """
-        words = set()
-        
-        if not self.legal_words_file.exists():
+        try:
+            st = self.legal_words_file.stat()
+        except FileNotFoundError:
             logger.warning(f"Legal words file not found: {self.legal_words_file}")
+            return frozenset()
+        
+        key = (str(self.legal_words_file), st.st_mtime_ns, st.st_size)
+        words = _DICT_CACHE.get(key)
+        if words is not None:
             return words
             
         try:
-            with open(self.legal_words_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip comments and empty lines
-                    if line and not line.startswith('#'):
-                        words.add(line.upper())
-                        
+            lines = self.legal_words_file.read_text(encoding='utf-8').splitlines()
+            # Skip comments and empty lines
+            words = frozenset(
+                line.upper() for line in map(str.strip, lines)
+                if line and not line.startswith('#')
+            )
+            _DICT_CACHE[key] = words
             logger.info(f"Loaded {len(words)} legal words from {self.legal_words_file}")
             
         except Exception as e:
             logger.error(f"Error loading legal words: {e}")
+            words = frozenset()
             
         return words
     
@@ -115,11 +126,16 @@ class LegalDictionaryManager:
             return corrections
             
         try:
-            with open(self.corrections_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if 'incorrect' in row and 'correct' in row:
-                        corrections[row['incorrect']] = row['correct']
+            with open(self.corrections_file, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, None) or []
+                # Column positions are resolved once from the header; rows stay
+                # plain lists instead of one dict per row
+                if 'incorrect' in header and 'correct' in header:
+                    src = header.index('incorrect')
+                    dst = header.index('correct')
+                    width = max(src, dst)
+                    corrections = {row[src]: row[dst] for row in reader if len(row) > width}
                         
             logger.info(f"Loaded {len(corrections)} corrections from {self.corrections_file}")
             
@@ -138,27 +154,43 @@ class LegalDictionaryManager:
         Returns:
             True if word was added, False if it already exists
         """
-        word = word.upper().strip()
-        if not word:
-            return False
+        return bool(self.add_legal_words([word]))
+    
+    def add_legal_words(self, words: Iterable[str]) -> List[str]:
+        """
+        Add several legal words with a single append to the dictionary.
+        
+        Known words are filtered out with one set difference against the
+        cached dictionary instead of a lookup per word.
+        
+        Args:
+            words: Words to add (will be converted to uppercase)
             
-        existing_words = self.load_legal_words()
+        Returns:
+            Words actually added, in input order
+        """
+        # Normalized candidates, deduplicated in input order
+        candidates = dict.fromkeys(w for w in (word.upper().strip() for word in words) if w)
+        new_words = candidates.keys() - self.load_legal_words()
         
-        if word in existing_words:
+        for word in candidates.keys() - new_words:
             logger.info(f"Word '{word}' already exists in dictionary")
-            return False
+        if not new_words:
+            return []
             
+        added = [word for word in candidates if word in new_words]
         try:
             # Append to file
             with open(self.legal_words_file, 'a', encoding='utf-8') as f:
-                f.write(f"\n{word}")
+                f.write("".join(f"\n{word}" for word in added))
                 
-            logger.info(f"Added word '{word}' to legal dictionary")
-            return True
+            for word in added:
+                logger.info(f"Added word '{word}' to legal dictionary")
+            return added
             
         except Exception as e:
-            logger.error(f"Error adding word '{word}': {e}")
-            return False
+            logger.error(f"Error adding words {added}: {e}")
+            return []
     
     def add_correction(self, incorrect: str, correct: str) -> bool:
         """
@@ -171,6 +203,22 @@ class LegalDictionaryManager:
         Returns:
             True if correction was added successfully
         """
+        return self.add_corrections([(incorrect, correct)]) == 1
+    
+    def add_corrections(self, corrections: Iterable[Tuple[str, str]]) -> int:
+        """
+        Append several OCR correction mappings with a single file open.
+        
+        Each row is flushed as it is written, so an interrupted batch keeps
+        the corrections already recorded.
+        
+        Args:
+            corrections: (incorrect, correct) pairs
+            
+        Returns:
+            Number of corrections written
+        """
+        written = 0
         try:
             # Check if file exists and has headers
             file_exists = self.corrections_file.exists()
@@ -182,14 +230,16 @@ class LegalDictionaryManager:
                 if not file_exists:
                     writer.writerow(['incorrect', 'correct', 'frequency', 'context'])
                     
-                writer.writerow([incorrect, correct, '1', 'manual'])
-                
-            logger.info(f"Added correction: '{incorrect}' -> '{correct}'")
-            return True
+                for incorrect, correct in corrections:
+                    writer.writerow([incorrect, correct, '1', 'manual'])
+                    f.flush()
+                    written += 1
+                    logger.info(f"Added correction: '{incorrect}' -> '{correct}'")
             
         except Exception as e:
             logger.error(f"Error adding correction: {e}")
-            return False
+            
+        return written
     
     def validate_dictionary(self) -> Dict[str, List[str]]:
         """
@@ -250,15 +300,18 @@ class LegalDictionaryManager:
             True if export was successful
         """
         try:
+            words = self.load_legal_words()
+            patterns = self.load_legal_patterns()
+            corrections = self.load_corrections()
             data = {
-                'legal_words': list(self.load_legal_words()),
-                'legal_patterns': self.load_legal_patterns(),
-                'corrections': self.load_corrections(),
+                'legal_words': list(words),
+                'legal_patterns': patterns,
+                'corrections': corrections,
                 'metadata': {
                     'version': '1.0',
-                    'total_words': len(self.load_legal_words()),
-                    'total_patterns': len(self.load_legal_patterns()),
-                    'total_corrections': len(self.load_corrections())
+                    'total_words': len(words),
+                    'total_patterns': len(patterns),
+                    'total_corrections': len(corrections)
                 }
             }
             
@@ -287,9 +340,9 @@ def main():
     
     # Add command
     add_parser = subparsers.add_parser('add', help='Add new entries')
-    add_parser.add_argument('--word', help='Add a legal word')
-    add_parser.add_argument('--correction', nargs=2, metavar=('INCORRECT', 'CORRECT'),
-                           help='Add OCR correction mapping')
+    add_parser.add_argument('--word', action='append', help='Add a legal word (repeatable)')
+    add_parser.add_argument('--correction', nargs=2, action='append', metavar=('INCORRECT', 'CORRECT'),
+                           help='Add OCR correction mapping (repeatable)')
     
     # Validate command
     validate_parser = subparsers.add_parser('validate', help='Validate dictionary')
@@ -327,16 +380,18 @@ def main():
                 
     elif args.command == 'add':
         if args.word:
-            if manager.add_legal_word(args.word):
-                print(f"Added word: {args.word}")
-            else:
-                print(f"Word already exists or error occurred: {args.word}")
+            added = set(manager.add_legal_words(args.word))
+            for word in args.word:
+                if word.upper().strip() in added:
+                    print(f"Added word: {word}")
+                else:
+                    print(f"Word already exists or error occurred: {word}")
                 
         if args.correction:
-            incorrect, correct = args.correction
-            if manager.add_correction(incorrect, correct):
+            written = manager.add_corrections(args.correction)
+            for incorrect, correct in args.correction[:written]:
                 print(f"Added correction: '{incorrect}' -> '{correct}'")
-            else:
+            if written < len(args.correction):
                 print("Error adding correction")
                 
     elif args.command == 'validate':